@@ -1,4 +1,6 @@
 import os
+import re
+import copy
 import json
 import base64
 import hashlib
@@ -6,9 +8,11 @@ import time
 import threading
 import shutil
 import struct
+import zlib
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from PIL import Image
@@ -18,8 +22,215 @@ setattr(httpcore, 'SyncHTTPTransport', Any) #fixes http transport error
 from colorama import init, Fore, Style
 import asyncio
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _load_json_file(path: Path):
+    """Parse a JSON file with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_json_file(path: Path, data):
+    """Serialize data to a JSON file with orjson when available"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+def _ndjson_line(entry: Dict[str, str]) -> bytes:
+    """Serialize one NDJSON record (single dict on one line)"""
+    if orjson is not None:
+        return orjson.dumps(entry) + b'\n'
+    return (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+
 init(autoreset=True)
 
+# Extra instruction sent alongside mes_example fields; built once instead
+# of being re-created on every translate call
+_MES_EXAMPLE_INSTRUCTIONS = (
+    "Before each dialogue example, add the <START> tag in plain English "
+    "on its own line if it does not exist yet."
+)
+
+# Hot-path constants for translate_text/translate_texts
+_PLACEHOLDERS = frozenset({'{{char}}', '{{user}}'})
+_CHAR_RE = re.compile(r'\{\{char\}\}')
+
+# LLM response cleanup patterns for _clean_response, compiled once so the
+# per-call cost is just the bound sub() dispatch
+_REASONING_TAG_RE = re.compile(r'<\w+>[\s\S]*?<\/\w+>', re.IGNORECASE)
+_FENCE_OPEN_RE = re.compile(r'^```(\w+)?\n')
+_FENCE_CLOSE_RE = re.compile(r'\n```$')
+_LEADING_NOISE_RE = re.compile(r'^(?:\r?\n|---|\*)*')
+_TRAILING_NOISE_RE = re.compile(r'(?:\r?\n|---|\*)*$')
+
+# Sentinel used to pack several short fields into one Google request.
+# The lenient split pattern tolerates whitespace the service may inject.
+_BATCH_SEP = "\n@@SEP@@\n"
+_BATCH_SEP_RE = re.compile(r'\s*@@\s*SEP\s*@@\s*', re.IGNORECASE)
+
+_ensured_dirs = set()
+
+def ensure_dir(path):
+    """Create a directory once per process; repeat calls are a set lookup"""
+    key = str(path)
+    if key in _ensured_dirs:
+        return
+    os.makedirs(key, exist_ok=True)
+    _ensured_dirs.add(key)
+
+def _recursive_split(text: str, limit: int, seps=('\n\n', '\n', '. ', '! ', '? ', ' ')) -> list:
+    """Split text into pieces under limit, trying coarser separators first.
+
+    Falls back from paragraphs to lines to sentences to words, and only
+    hard-breaks when a single word exceeds the limit, so chunks always stay
+    translatable without cutting mid-sentence where avoidable.
+    """
+    if len(text) <= limit:
+        return [text]
+    for sep in seps:
+        if sep in text:
+            parts = text.split(sep)
+            pieces = [p + sep for p in parts[:-1]] + [parts[-1]]
+            # A lone trailing/leading separator reproduces the input (one
+            # piece is the whole text); recursing on it would never
+            # terminate, so fall through to a finer separator instead
+            if max(len(piece) for piece in pieces) >= len(text):
+                continue
+            chunks = []
+            for piece in pieces:
+                if len(piece) > limit:
+                    chunks.extend(_recursive_split(piece, limit, seps))
+                else:
+                    chunks.append(piece)
+            return chunks
+    # no separator made progress: hard break
+    return [text[i:i + limit] for i in range(0, len(text), limit)]
+
+def _is_transient_error(exc: Exception) -> bool:
+    """Heuristic for errors worth retrying (rate limits, network blips)"""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    message = str(exc).lower()
+    return any(token in message for token in ('429', 'too many requests', 'timeout', 'temporarily', 'connection'))
+
+def _read_png_text_chunks(path) -> Dict[str, list]:
+    """Read tEXt/iTXt/zTXt chunks from a PNG without touching pixel data.
+
+    Returns a mapping of keyword -> list of raw byte values. Duplicate
+    keywords are preserved, unlike PIL's info/text dictionaries which only
+    keep the last occurrence, and IDAT is seeked past rather than decoded.
+    """
+    chunks: Dict[str, list] = {}
+    with open(path, 'rb') as f:
+        if f.read(8) != b'\x89PNG\r\n\x1a\n':
+            return chunks
+        while True:
+            length_data = f.read(4)
+            if len(length_data) < 4:
+                break
+            length = struct.unpack('>I', length_data)[0]
+            chunk_type = f.read(4)
+
+            if chunk_type in (b'tEXt', b'iTXt', b'zTXt'):
+                data = f.read(length)
+                f.seek(4, 1)  # skip CRC
+                keyword, sep, value = data.partition(b'\x00')
+                if not sep:
+                    continue
+                if chunk_type == b'zTXt' and value[:1] == b'\x00':
+                    try:
+                        value = zlib.decompress(value[1:])
+                    except zlib.error:
+                        continue
+                elif chunk_type == b'iTXt' and len(value) >= 2:
+                    compressed = value[0] == 1
+                    # skip compression flag/method, language tag and
+                    # translated keyword (both null-terminated)
+                    rest = value[2:].partition(b'\x00')[2].partition(b'\x00')[2]
+                    if compressed:
+                        try:
+                            rest = zlib.decompress(rest)
+                        except zlib.error:
+                            continue
+                    value = rest
+                chunks.setdefault(keyword.decode('latin-1', 'replace'), []).append(value)
+            else:
+                f.seek(length + 4, 1)
+
+            if chunk_type == b'IEND':
+                break
+    return chunks
+
+def _rewrite_png_text(src: Path, dst: Path, updates: Dict[str, str]):
+    """Rewrite a PNG replacing only the given text-chunk keywords.
+
+    Every chunk is copied verbatim except existing tEXt/iTXt/zTXt chunks
+    whose keyword is in updates; the replacement tEXt chunks are spliced in
+    just before IEND. The image data is never re-encoded, so writing a
+    card costs a file copy instead of a full zlib compress.
+    """
+    data = src.read_bytes()
+    if data[:8] != b'\x89PNG\r\n\x1a\n':
+        raise ValueError(f"{src} is not a PNG file")
+
+    drop = {keyword.encode('latin-1') for keyword in updates}
+    out = [data[:8]]
+    pos = 8
+    total = len(data)
+    while pos + 8 <= total:
+        length = struct.unpack('>I', data[pos:pos + 4])[0]
+        chunk_type = data[pos + 4:pos + 8]
+        end = pos + 12 + length
+
+        if chunk_type == b'IEND':
+            for keyword, value in updates.items():
+                payload = keyword.encode('latin-1') + b'\x00' + value.encode('latin-1')
+                out.append(struct.pack('>I', len(payload)))
+                out.append(b'tEXt' + payload)
+                out.append(struct.pack('>I', zlib.crc32(b'tEXt' + payload) & 0xffffffff))
+            out.append(data[pos:end])
+            break
+
+        if chunk_type in (b'tEXt', b'iTXt', b'zTXt'):
+            keyword = data[pos + 8:pos + 8 + length].split(b'\x00', 1)[0]
+            if keyword in drop:
+                pos = end
+                continue
+
+        out.append(data[pos:end])
+        pos = end
+
+    dst.write_bytes(b''.join(out))
+
+def _sig(text: str) -> bytes:
+    """Short content signature for cheap whitespace-insensitive equality"""
+    return hashlib.blake2b(text.strip().encode('utf-8'), digest_size=8).digest()
+
+def _memo_key(text: str, lang: str) -> str:
+    """Compact key for the persistent translation memo"""
+    return hashlib.blake2b(text.encode('utf-8') + lang.encode('utf-8'), digest_size=16).hexdigest()
+
+def _iter_pngs(directory):
+    """Yield DirEntry objects for PNG files without glob/fnmatch overhead.
+
+    The directory is scanned as bytes so entry names cross the syscall
+    boundary without a decode round-trip; callers use os.fsdecode on
+    .name/.path only where a str is actually needed.
+    """
+    return (e for e in os.scandir(os.fsencode(str(directory)))
+            if e.name.endswith(b'.png') and e.is_file(follow_symlinks=False))
+
 @dataclass
 class Config:
     """Configuration settings"""
@@ -36,12 +247,20 @@ class Config:
     model: str = "meta-llama/llama-3.1-8b-instruct"
     provider: str = "openrouter"  # groq, openrouter or nanogpt
     personas_translated: bool = False
+    max_workers: int = 4  # concurrent cards while bulk processing
+    # Route bulk runs through the provider's Batch API (~half cost, but
+    # jobs may take up to 24h to complete); LLM service only
+    use_batch_api: bool = False
 
 class Translator:
     """Base translator class"""
     def translate(self, text: str, target_lang: str, extra_instructions: Optional[str] = None) -> str:
         raise NotImplementedError
 
+    def translate_many(self, texts: list, target_lang: str, extra_instructions: Optional[str] = None) -> list:
+        """Translate several texts; subclasses may dispatch them concurrently"""
+        return [self.translate(t, target_lang, extra_instructions) for t in texts]
+
 class GoogleTranslator(Translator):
     """Free Google Translate service with chunking support"""
     
@@ -50,7 +269,18 @@ class GoogleTranslator(Translator):
             from googletrans import Translator as GT
             self.translator = GT()
             self.max_chunk_size = 4500
-            
+
+            # Simple rate limiter: requests are spaced min_interval apart
+            # so bursts don't trip the endpoint's ban threshold
+            self._rate_lock = threading.Lock()
+            self._next_slot = 0.0
+            self.min_interval = 0.2
+
+            # Coalesce concurrent identical requests: at most one network
+            # call is in flight per unique (text, target_lang) pair
+            self._inflight: Dict[tuple, Future] = {}
+            self._inflight_lock = threading.Lock()
+
             # create a dedicated event loop for translations
             self.loop = asyncio.new_event_loop()
             self.thread = threading.Thread(target=self._run_event_loop, daemon=True)
@@ -65,69 +295,225 @@ class GoogleTranslator(Translator):
         """Run the event loop in a separate thread"""
         asyncio.set_event_loop(self.loop)
         self.loop.run_forever()
+
+    def _acquire_slot(self):
+        """Block until the rate limiter allows another request"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def _translate_with_retry(self, coro_factory, timeout: float = 30):
+        """Run a translation coroutine with retry and exponential backoff.
+
+        Transient failures (rate limits, dropped connections, timeouts) are
+        retried up to 5 times; permanent errors are raised immediately so
+        they are not silently papered over with untranslated text.
+        """
+        delay = 1.0
+        max_attempts = 5
+        for attempt in range(max_attempts):
+            self._acquire_slot()
+            try:
+                future = asyncio.run_coroutine_threadsafe(coro_factory(), self.loop)
+                return future.result(timeout=timeout)
+            except Exception as e:
+                if attempt == max_attempts - 1 or not _is_transient_error(e):
+                    raise
+                print(f"Transient translation error ({e}); retrying in {delay:.0f}s...")
+                time.sleep(delay)
+                delay = min(delay * 2, 60)
     
     def translate(self, text: str, target_lang: str, extra_instructions: Optional[str] = None) -> str:
         if not self.translator or not text or not text.strip() or not self.loop:
             return text
-            
+
+        # If another thread is already translating this exact text, wait
+        # for its result instead of issuing a duplicate request
+        key = (text, target_lang)
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = Future()
+                self._inflight[key] = pending
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return pending.result()
+
+        try:
+            result = self._do_translate(text, target_lang)
+            pending.set_result(result)
+            return result
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _do_translate(self, text: str, target_lang: str) -> str:
         try:
             # If text is short enough, translate directly
             if len(text) <= self.max_chunk_size:
-                future = asyncio.run_coroutine_threadsafe(
-                    self.translator.translate(text, dest=target_lang),
-                    self.loop
-                )
-                result = future.result(timeout=30)  # 30 second timeout
+                result = self._translate_with_retry(
+                    lambda: self.translator.translate(text, dest=target_lang))
                 return result.text if result and hasattr(result, 'text') else text
-            
+
             # for long texts, split into chunks
             return self._translate_chunked(text, target_lang)
-                
+
         except Exception as e:
             print(f"Translation error: {e}")
             return text
     
+    def translate_many(self, texts: list, target_lang: str, extra_instructions: Optional[str] = None) -> list:
+        """Translate several texts concurrently.
+
+        Short texts are packed into sentinel batches where possible and
+        otherwise overlapped on a small pool, all throttled by the shared
+        rate limiter; long texts still go through the chunked path
+        individually.
+        """
+        if not self.translator or not self.loop:
+            return list(texts)
+
+        results = list(texts)
+        short_indices = [i for i, t in enumerate(texts)
+                         if t and t.strip() and len(t) <= self.max_chunk_size]
+
+        if short_indices:
+            batched = None
+            if len(short_indices) > 1:
+                # Try to pack the short texts into few delimiter-joined requests
+                try:
+                    batched = self._batch_translate([texts[i] for i in short_indices], target_lang)
+                except Exception as e:
+                    print(f"Batch translation error: {e}")
+
+            if batched is not None:
+                for i, translated in zip(short_indices, batched):
+                    results[i] = translated
+            else:
+                # Per-text dispatch overlapped on a small pool; going
+                # through _translate_with_retry keeps the rate limiter
+                # spacing and retry that a raw gather would bypass
+                def translate_one(i):
+                    try:
+                        return self._translate_with_retry(
+                            lambda: self.translator.translate(texts[i], dest=target_lang))
+                    except Exception as e:
+                        return e
+                with ThreadPoolExecutor(max_workers=min(4, len(short_indices))) as pool:
+                    gathered = list(pool.map(translate_one, short_indices))
+                for i, result in zip(short_indices, gathered):
+                    if not isinstance(result, Exception) and result and hasattr(result, 'text'):
+                        results[i] = result.text
+
+        for i, t in enumerate(texts):
+            if t and t.strip() and len(t) > self.max_chunk_size:
+                results[i] = self._translate_chunked(t, target_lang)
+
+        return results
+
+    def _batch_translate(self, texts: list, target_lang: str) -> Optional[list]:
+        """Pack several short texts into delimiter-joined requests.
+
+        Returns a list aligned with texts, or None when the sentinel did not
+        survive translation (the caller then falls back to per-text dispatch).
+        """
+        groups = []
+        current, current_len = [], 0
+        for t in texts:
+            extra = len(t) + len(_BATCH_SEP)
+            if current and current_len + extra > self.max_chunk_size:
+                groups.append(current)
+                current, current_len = [], 0
+            current.append(t)
+            current_len += extra
+        if current:
+            groups.append(current)
+
+        # Each group goes through _translate_with_retry so sentinel batches
+        # honour the same rate-limit spacing and retry as single requests
+        def translate_group(group):
+            try:
+                return self._translate_with_retry(
+                    lambda: self.translator.translate(_BATCH_SEP.join(group), dest=target_lang))
+            except Exception as e:
+                return e
+
+        if len(groups) == 1:
+            gathered = [translate_group(groups[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(4, len(groups))) as pool:
+                gathered = list(pool.map(translate_group, groups))
+
+        results = []
+        for group, result in zip(groups, gathered):
+            if isinstance(result, Exception) or not result or not hasattr(result, 'text'):
+                # this group failed outright; keep the originals
+                results.extend(group)
+                continue
+            parts = _BATCH_SEP_RE.split(result.text)
+            if len(parts) != len(group):
+                return None
+            results.extend(p.strip() for p in parts)
+        return results
+
     def _translate_chunked(self, text: str, target_lang: str) -> str:
         """Translate long text by splitting into chunks"""
-        # Split by paragraphs first (double newlines)
-        paragraphs = text.split('\n\n')
-        translated_paragraphs = []
-        current_chunk = ""
-        
+        # Split by paragraphs first (double newlines); paragraphs that are
+        # still too large fall back to line/sentence/word boundaries
+        paragraphs = []
+        for paragraph in text.split('\n\n'):
+            if len(paragraph) > self.max_chunk_size:
+                paragraphs.extend(_recursive_split(paragraph, self.max_chunk_size))
+            else:
+                paragraphs.append(paragraph)
+        # Pack paragraphs into chunks up front (list accumulation with a
+        # running length, so building each chunk is O(n)) and translate
+        # them afterwards so independent requests can overlap
+        chunks = []
+        current_parts = []
+        current_len = 0
+
         for paragraph in paragraphs:
-            # If adding this paragraph would exceed limit, translate current chunk
-            if len(current_chunk) + len(paragraph) + 2 > self.max_chunk_size and current_chunk:
-                try:
-                    future = asyncio.run_coroutine_threadsafe(
-                        self.translator.translate(current_chunk.strip(), dest=target_lang),
-                        self.loop
-                    )
-                    result = future.result(timeout=30)
-                    translated_paragraphs.append(result.text if result and hasattr(result, 'text') else current_chunk.strip())
-                    current_chunk = paragraph
-                except Exception as e:
-                    print(f"Chunk translation error: {e}")
-                    translated_paragraphs.append(current_chunk.strip())
-                    current_chunk = paragraph
+            # If adding this paragraph would exceed limit, close the chunk
+            if current_parts and current_len + len(paragraph) + 2 > self.max_chunk_size:
+                chunks.append('\n\n'.join(current_parts).strip())
+                current_parts = [paragraph]
+                current_len = len(paragraph)
             else:
-                if current_chunk:
-                    current_chunk += "\n\n" + paragraph
-                else:
-                    current_chunk = paragraph
-        
-        # Translate remaining chunk
-        if current_chunk:
+                current_parts.append(paragraph)
+                current_len += len(paragraph) + 2
+
+        if current_parts:
+            chunk = '\n\n'.join(current_parts).strip()
+            if chunk:
+                chunks.append(chunk)
+
+        def translate_chunk(chunk):
             try:
-                future = asyncio.run_coroutine_threadsafe(
-                    self.translator.translate(current_chunk.strip(), dest=target_lang),
-                    self.loop
-                )
-                result = future.result(timeout=30)
-                translated_paragraphs.append(result.text if result and hasattr(result, 'text') else current_chunk.strip())
+                result = self._translate_with_retry(
+                    lambda: self.translator.translate(chunk, dest=target_lang))
+                return result.text if result and hasattr(result, 'text') else chunk
             except Exception as e:
-                print(f"Final chunk translation error: {e}")
-                translated_paragraphs.append(current_chunk.strip())
-        
+                print(f"Chunk translation error: {e}")
+                return chunk
+
+        if len(chunks) <= 1:
+            translated_paragraphs = [translate_chunk(c) for c in chunks]
+        else:
+            # Each chunk is an independent request dominated by network
+            # wait; overlap them on a small pool while the rate limiter
+            # still spaces the actual calls
+            with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as pool:
+                translated_paragraphs = list(pool.map(translate_chunk, chunks))
+
         return '\n\n'.join(translated_paragraphs)
     
     def __del__(self):
@@ -135,18 +521,47 @@ class GoogleTranslator(Translator):
         if hasattr(self, 'loop') and self.loop:
             self.loop.call_soon_threadsafe(self.loop.stop)
 
+# Process-wide GoogleTranslator: each instance owns an httpx session plus
+# a dedicated event-loop thread, so reusing one across settings changes
+# keeps the connection pool warm instead of redoing TLS handshakes and
+# leaving orphaned loop threads behind
+_google_translator_instance = None
+_google_translator_lock = threading.Lock()
+
+def _get_shared_google_translator() -> GoogleTranslator:
+    global _google_translator_instance
+    if _google_translator_instance is None:
+        with _google_translator_lock:
+            if _google_translator_instance is None:
+                _google_translator_instance = GoogleTranslator()
+    return _google_translator_instance
+
 class LLMTranslator(Translator):
     """LLM-based translator (Groq/OpenRouter)"""
     def __init__(self, api_key: str, provider: str, model: str):
         self.api_key = api_key
         self.provider = provider
         self.model = model
-        
-    def translate(self, text: str, target_lang: str, extra_instructions: Optional[str] = None) -> str:
-        if not self.api_key:
-            return text
-            
-        system_prompt = f"""You are a high-precision translation engine specializing in roleplay character cards. 
+        # created lazily on first use and reused so every call shares one
+        # connection pool instead of paying a TLS handshake per request
+        self._client = None
+
+    def _get_client(self):
+        """Create the provider client once and reuse it across calls"""
+        if self._client is None:
+            if self.provider == "groq":
+                from groq import Groq
+                self._client = Groq(api_key=self.api_key)
+            else:
+                import openai
+                base_url = ("https://openrouter.ai/api/v1" if self.provider == "openrouter"
+                            else "https://nano-gpt.com/api/v1")
+                self._client = openai.OpenAI(base_url=base_url, api_key=self.api_key)
+        return self._client
+
+    def _build_messages(self, text: str, target_lang: str, extra_instructions: Optional[str] = None) -> list:
+        """Build the chat messages for one translation request"""
+        system_prompt = f"""You are a high-precision translation engine specializing in roleplay character cards.
 Your task is to provide a 1:1 translation from English to {target_lang}.
 
 ### STRICT PROTOCOLS:
@@ -166,11 +581,17 @@ Your task is to provide a 1:1 translation from English to {target_lang}.
 
 ### {target_lang.upper()} TRANSLATION:"""
 
-        messages = [
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_content}
         ]
-        
+
+    def translate(self, text: str, target_lang: str, extra_instructions: Optional[str] = None) -> str:
+        if not self.api_key:
+            return text
+
+        messages = self._build_messages(text, target_lang, extra_instructions)
+
         try:
             if self.provider == "groq":
                 result = self._groq_translate(messages)
@@ -190,66 +611,123 @@ Your task is to provide a 1:1 translation from English to {target_lang}.
             return ""
         
         # Remove reasoning tags if any
-        import re
-        text = re.sub(r'<\w+>[\s\S]*?<\/\w+>', '', text, flags=re.IGNORECASE)
-        
+        text = _REASONING_TAG_RE.sub('', text)
+
         # Remove code blocks if LLM wrapped it
-        text = re.sub(r'^```(\w+)?\n', '', text)
-        text = re.sub(r'\n```$', '', text)
-        
+        text = _FENCE_OPEN_RE.sub('', text)
+        text = _FENCE_CLOSE_RE.sub('', text)
+
         # Remove common hallucinated markers or horizontal rules at start/end
-        text = re.sub(r'^(?:\r?\n|---|\*)*', '', text)
-        text = re.sub(r'(?:\r?\n|---|\*)*$', '', text)
-        
+        text = _LEADING_NOISE_RE.sub('', text)
+        text = _TRAILING_NOISE_RE.sub('', text)
+
         return text.strip()
     
     def _groq_translate(self, messages: list) -> str:
         try:
-            from groq import Groq
-            client = Groq(api_key=self.api_key)
-            response = client.chat.completions.create(
-                messages=messages,
-                model=self.model,
-                temperature=0.1
-            )
-            return response.choices[0].message.content
+            client = self._get_client()
         except ImportError:
             print("Groq library not installed. Run: pip install groq")
             return ""
-    
+        response = client.chat.completions.create(
+            messages=messages,
+            model=self.model,
+            temperature=0.1
+        )
+        return response.choices[0].message.content
+
     def _openrouter_translate(self, messages: list) -> str:
         try:
-            import openai
-            client = openai.OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=self.api_key
-            )
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.1
-            )
-            return response.choices[0].message.content
+            client = self._get_client()
         except ImportError:
             print("OpenAI library not installed. Run: pip install openai")
             return ""
+        response = client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.1
+        )
+        return response.choices[0].message.content
 
     def _nanogpt_translate(self, messages: list) -> str:
         try:
-            import openai
-            client = openai.OpenAI(
-                base_url="https://nano-gpt.com/api/v1",
-                api_key=self.api_key
-            )
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.1
-            )
-            return response.choices[0].message.content
+            client = self._get_client()
         except ImportError:
             print("OpenAI library not installed. Run: pip install openai")
             return ""
+        response = client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.1
+        )
+        return response.choices[0].message.content
+
+    def batch_translate(self, texts: list, target_lang: str,
+                        poll_interval: float = 10.0, timeout: float = 3600.0) -> list:
+        """Translate many texts through the provider's OpenAI-style Batch API.
+
+        Meant for large offline runs where latency does not matter: one
+        batch job is roughly half the cost of synchronous completions.
+        Falls back to sequential translate() calls when the provider has no
+        batch endpoint or the job fails.
+        """
+        if not self.api_key or not texts:
+            return list(texts)
+        if self.provider == "groq":
+            # groq's batch offering is not OpenAI-compatible; stay sequential
+            return [self.translate(t, target_lang) for t in texts]
+
+        try:
+            client = self._get_client()
+        except ImportError:
+            print("OpenAI library not installed. Run: pip install openai")
+            return list(texts)
+
+        try:
+            lines = []
+            for i, text in enumerate(texts):
+                body = {
+                    "model": self.model,
+                    "messages": self._build_messages(text, target_lang),
+                    "temperature": 0.1
+                }
+                lines.append(json.dumps(
+                    {"custom_id": str(i), "method": "POST",
+                     "url": "/v1/chat/completions", "body": body},
+                    ensure_ascii=False))
+            payload = "\n".join(lines).encode('utf-8')
+
+            batch_file = client.files.create(file=("translations.jsonl", payload), purpose="batch")
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            deadline = time.monotonic() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"batch {batch.id} still '{batch.status}' after {timeout:.0f}s")
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"batch {batch.id} ended with status '{batch.status}'")
+
+            results = list(texts)
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                idx = int(entry.get("custom_id", -1))
+                choices = ((entry.get("response") or {}).get("body") or {}).get("choices") or []
+                if 0 <= idx < len(results) and choices:
+                    results[idx] = self._clean_response(choices[0]["message"]["content"])
+            return results
+
+        except Exception as e:
+            print(f"Batch API translation failed ({e}); falling back to sequential calls")
+            return [self.translate(t, target_lang) for t in texts]
 
 class CharacterProcessor:
     """Main character card processor"""
@@ -257,14 +735,25 @@ class CharacterProcessor:
     def __init__(self, config_file: str = "config.json"):
         self.config_file = Path(config_file)
         self.config = self.load_config()
-        self.db_file = Path("translation_db.json")
+        self.db_file = Path("translation_db.ndjson")
         self.db = self.load_db()
+        # Guards db mutation/saving: the watchdog observer thread and the
+        # main thread can both finish processing a card concurrently
+        self._db_lock = threading.RLock()
+        # Memoized file hashes keyed by (path, mtime_ns, size) so unchanged
+        # files are never hashed twice in one run
+        self._hash_cache: Dict[tuple, str] = {}
+        # Persistent cross-card translation memo: identical text is only
+        # ever sent to the translation service once per target language
+        self.memo_file = Path("translation_memo.json")
+        self.memo = self.load_memo()
+        self._memo_dirty = False
         self.translator = self.setup_translator()
         self.monitoring = False
         
         # Create necessary directories
         self.original_dir = Path("./Original")
-        self.original_dir.mkdir(exist_ok=True)
+        ensure_dir(self.original_dir)
 
     @property
     def settings_file(self) -> Optional[Path]:
@@ -284,8 +773,7 @@ class CharacterProcessor:
         """Load configuration from file"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json_file(self.config_file)
                 return Config(**data)
             except Exception as e:
                 print(f"Error loading config: {e}")
@@ -299,25 +787,79 @@ class CharacterProcessor:
         """Save configuration to file"""
         if config is None:
             config = self.config
-        
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(config), f, indent=2, ensure_ascii=False)
+
+        # dataclass fields are flat, so __dict__ avoids the asdict() walk
+        _save_json_file(self.config_file, config.__dict__)
     
     def load_db(self) -> Dict[str, str]:
-        """Load translation database"""
+        """Load translation database from its append-only NDJSON file"""
+        legacy_file = Path("translation_db.json")
+        if not self.db_file.exists() and legacy_file.exists():
+            # one-time migration from the old single-document format
+            try:
+                db = _load_json_file(legacy_file)
+                self._rewrite_db(db)
+                legacy_file.unlink()
+                return db
+            except Exception:
+                pass
+
         if self.db_file.exists():
             try:
-                with open(self.db_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                db = {}
+                line_count = 0
+                with open(self.db_file, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        line_count += 1
+                        try:
+                            db.update(orjson.loads(line) if orjson is not None
+                                      else json.loads(line))
+                        except Exception:
+                            continue
+                # Compact once superseded entries dominate the file
+                if line_count > 2 * max(1, len(db)):
+                    self._rewrite_db(db)
+                return db
             except Exception:
                 pass
         return {}
-    
+
+    def _rewrite_db(self, db: Dict[str, str]):
+        """Rewrite the NDJSON database from scratch (compaction)"""
+        with open(self.db_file, 'wb') as f:
+            for name, file_hash in db.items():
+                f.write(_ndjson_line({name: file_hash}))
+
     def save_db(self):
-        """Save translation database"""
-        with open(self.db_file, 'w', encoding='utf-8') as f:
-            json.dump(self.db, f, indent=2)
+        """Rewrite the full translation database (used after bulk edits)"""
+        with self._db_lock:
+            self._rewrite_db(self.db)
+
+    def save_db_entry(self, name: str, file_hash: str):
+        """Append a single database entry; O(1) versus a full rewrite"""
+        with open(self.db_file, 'ab') as f:
+            f.write(_ndjson_line({name: file_hash}))
     
+    def load_memo(self) -> Dict[str, str]:
+        """Load persistent translation memo"""
+        if self.memo_file.exists():
+            try:
+                return _load_json_file(self.memo_file)
+            except Exception:
+                pass
+        return {}
+
+    def save_memo(self):
+        """Save the translation memo if new entries were added"""
+        if not self._memo_dirty:
+            return
+        with self._db_lock:
+            _save_json_file(self.memo_file, self.memo)
+            self._memo_dirty = False
+
     def setup_translator(self) -> Translator:
         """Setup the appropriate translator"""
         if self.config.service == "llm":
@@ -330,43 +872,40 @@ class CharacterProcessor:
                 api_key = self.config.nanogpt_api_key
             return LLMTranslator(api_key, self.config.provider, self.config.model)
         else:
-            return GoogleTranslator()
+            return _get_shared_google_translator()
     
     def get_file_hash(self, file_path: Path) -> str:
-        """Get MD5 hash of file"""
-        with open(file_path, 'rb') as f:
-            return hashlib.md5(f.read()).hexdigest()
+        """Get content hash of file (BLAKE3 over mmap when available, MD5 otherwise)"""
+        st = os.stat(file_path)
+        key = (str(file_path), st.st_mtime_ns, st.st_size)
+        cached = self._hash_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if blake3 is not None:
+            # lets the kernel page in only what is touched and hashes in parallel
+            h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            h.update_mmap(str(file_path))
+            digest = h.hexdigest()
+        else:
+            # stream in 1MB chunks instead of loading the whole card in memory
+            h = hashlib.md5()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+            digest = h.hexdigest()
+
+        if len(self._hash_cache) >= 1024:
+            # simple FIFO eviction; 1024 entries is plenty for one library
+            self._hash_cache.pop(next(iter(self._hash_cache)))
+        self._hash_cache[key] = digest
+        return digest
     
     def extract_character_data(self, image_path: Path) -> Optional[Dict]:
         """Extract character data from PNG image using manual parsing to handle multiple chunks"""
         try:
-            chara_chunks = []
-            
-            # manually parse PNG chunks to find all 'chara' keyword chunks
-            # PIL's info/text dictionaries only store the last occurrence of a key
-            with open(image_path, 'rb') as f:
-                sig = f.read(8)
-                if sig == b'\x89PNG\r\n\x1a\n':
-                    while True:
-                        length_data = f.read(4)
-                        if not length_data:
-                            break
-                        length = struct.unpack('>I', length_data)[0]
-                        chunk_type = f.read(4)
-                        
-                        # we look for tEXt, zTXt and iTXt chunks
-                        if chunk_type in [b'tEXt', b'iTXt', b'zTXt']:
-                            data = f.read(length)
-                            # check if it starts with 'chara\0'
-                            if data.startswith(b'chara\x00'):
-                                # keyword is separated by null byte from the value
-                                chara_chunks.append(data[6:])
-                        else:
-                            f.seek(length, 1)
-                        
-                        f.read(4) # skip CRC
-                        if chunk_type == b'IEND':
-                            break
+            # stream only the text chunks; pixel data is never decoded
+            chara_chunks = _read_png_text_chunks(image_path).get('chara', [])
 
             # fallback to PIL if manual parsing didn't find anything or for non-PNG formats
             if not chara_chunks:
@@ -416,39 +955,119 @@ class CharacterProcessor:
             return text
         
         # Skip translation for very short text or placeholders
-        if len(text.strip()) < 3 or text.strip() in ['{{char}}', '{{user}}']:
+        if len(text.strip()) < 3 or text.strip() in _PLACEHOLDERS:
             return text
-        
+
         # Replace character name temporarily if needed
         original_text = text
         if char_name and self.config.use_char_name:
-            text = text.replace('{{char}}', char_name)
+            text = _CHAR_RE.sub(lambda _: char_name, text)
         
         extra_instructions = None
         # Add special instruction for mes_example
         if field_name == 'mes_example':
-            extra_instructions = "Before each dialogue example, add the <START> tag in plain English on its own line if it does not exist yet."
-        
-        # Translate
-        translated = self.translator.translate(text, self.config.target_lang, extra_instructions)
+            extra_instructions = _MES_EXAMPLE_INSTRUCTIONS
         
+        # Check the persistent memo before hitting the network
+        memo_key = _memo_key(text, self.config.target_lang)
+        translated = self.memo.get(memo_key)
+        if translated is None:
+            translated = self.translator.translate(text, self.config.target_lang, extra_instructions)
+            if translated and translated != text:
+                # Inserts race with save_memo's serialization pass, so they
+                # share _db_lock (worker threads call this concurrently)
+                with self._db_lock:
+                    self.memo[memo_key] = translated
+                    self._memo_dirty = True
+
         # Restore character placeholder
         if char_name and self.config.use_char_name:
             translated = translated.replace(char_name, '{{char}}')
         
         return translated if translated != original_text else original_text
     
+    def translate_texts(self, texts: list, char_name: Optional[str] = None, field_name: Optional[str] = None) -> list:
+        """Batch version of translate_text; dispatches all texts in one call"""
+        results = list(texts)
+        prepared = []
+        indices = []
+        for i, text in enumerate(texts):
+            if not text or not isinstance(text, str):
+                continue
+            if len(text.strip()) < 3 or text.strip() in _PLACEHOLDERS:
+                continue
+            if char_name and self.config.use_char_name:
+                text = _CHAR_RE.sub(lambda _: char_name, text)
+            prepared.append(text)
+            indices.append(i)
+
+        if not prepared:
+            return results
+
+        extra_instructions = None
+        if field_name == 'mes_example':
+            extra_instructions = _MES_EXAMPLE_INSTRUCTIONS
+
+        # Resolve memo hits locally; only misses go out in the batch
+        lang = self.config.target_lang
+        to_send = []
+        send_slots = []
+        for slot, text in zip(indices, prepared):
+            key = _memo_key(text, lang)
+            cached = self.memo.get(key)
+            if cached is not None:
+                translated_text = cached
+                if char_name and self.config.use_char_name:
+                    translated_text = translated_text.replace(char_name, '{{char}}')
+                results[slot] = translated_text
+            else:
+                to_send.append(text)
+                send_slots.append((slot, key))
+
+        if to_send:
+            translated = self.translator.translate_many(to_send, lang, extra_instructions)
+            for (slot, key), text, translated_text in zip(send_slots, to_send, translated):
+                if translated_text and translated_text != text:
+                    # Same locking as translate_text: keep save_memo from
+                    # serializing the dict mid-insert
+                    with self._db_lock:
+                        self.memo[key] = translated_text
+                        self._memo_dirty = True
+                if char_name and self.config.use_char_name:
+                    translated_text = translated_text.replace(char_name, '{{char}}')
+                results[slot] = translated_text
+        return results
+
+    def _translate_greeting_list(self, greetings: list, char_name: Optional[str], translation_cache: Dict[str, str]) -> list:
+        """Translate a greetings list, batching cache misses into one dispatch"""
+        results = list(greetings)
+        miss_indices = []
+        for i, greeting in enumerate(greetings):
+            if isinstance(greeting, str) and greeting.strip():
+                if greeting in translation_cache:
+                    results[i] = translation_cache[greeting]
+                else:
+                    miss_indices.append(i)
+
+        if miss_indices:
+            translated = self.translate_texts([greetings[i] for i in miss_indices], char_name, 'alternate_greetings')
+            for i, translated_greeting in zip(miss_indices, translated):
+                results[i] = translated_greeting
+                translation_cache[greetings[i]] = translated_greeting
+        return results
+
     def fields_are_identical(self, field1: str, field2: str) -> bool:
         """Check if two fields contain identical content (ignoring whitespace)"""
         if not field1 or not field2:
             return False
-        return field1.strip() == field2.strip()
+        return _sig(field1) == _sig(field2)
     
     def translate_character_data(self, data: Dict, char_name: Optional[str] = None) -> Dict:
         """Translate character data fields with duplicate detection"""
-        # Create a deep copy to avoid modifying original
-        original_data = json.loads(json.dumps(data))  # Keep original for comparison
-        translated_data = json.loads(json.dumps(data))
+        # Single deep copy to mutate; the input dict itself stays pristine
+        # and serves as the original for comparisons
+        original_data = data
+        translated_data = copy.deepcopy(data)
         
         # Main translatable fields at root level
         root_translatable_fields = [
@@ -480,19 +1099,8 @@ class CharacterProcessor:
         # Handle alternate greetings at root level
         if self.config.translate_greetings and 'alternate_greetings' in translated_data and isinstance(translated_data['alternate_greetings'], list):
             print(f"  Translating {len(translated_data['alternate_greetings'])} root alternate greetings...")
-            translated_greetings = []
-            for i, greeting in enumerate(translated_data['alternate_greetings']):
-                if isinstance(greeting, str) and greeting.strip():
-                    # Check cache first
-                    if greeting in translation_cache:
-                        translated_greetings.append(translation_cache[greeting])
-                    else:
-                        translated_greeting = self.translate_text(greeting, char_name, 'alternate_greetings')
-                        translated_greetings.append(translated_greeting)
-                        translation_cache[greeting] = translated_greeting
-                else:
-                    translated_greetings.append(greeting)
-            translated_data['alternate_greetings'] = translated_greetings
+            translated_data['alternate_greetings'] = self._translate_greeting_list(
+                translated_data['alternate_greetings'], char_name, translation_cache)
         
         # Handle the nested 'data' object with duplicate detection
         if has_data_object:
@@ -505,8 +1113,23 @@ class CharacterProcessor:
                 'creator_notes', 'system_prompt', 'post_history_instructions'
             ]
             
+            # Fast path: most v2 cards mirror every root field into data.
+            # Compare the whole shared subset with one signature tuple; when
+            # identical, copy the translated root values wholesale and skip
+            # the per-field equality checks entirely.
+            shared_fields = [f for f in data_translatable_fields if f in root_translatable_fields]
+            root_sig = tuple(_sig(str(original_data.get(f, ''))) for f in shared_fields)
+            data_sig = tuple(_sig(str(original_data_obj.get(f, ''))) for f in shared_fields)
+            if root_sig == data_sig:
+                for field in shared_fields:
+                    if field in data_obj and field in translated_data:
+                        data_obj[field] = translated_data[field]
+                fields_to_check = [f for f in data_translatable_fields if f not in root_translatable_fields]
+            else:
+                fields_to_check = data_translatable_fields
+
             # Translate data object fields, checking for duplicates
-            for field in data_translatable_fields:
+            for field in fields_to_check:
                 if field in data_obj and isinstance(data_obj[field], str) and data_obj[field].strip():
                     # Check if this field is identical to ORIGINAL root field
                     original_root_value = original_data.get(field, '')
@@ -551,27 +1174,18 @@ class CharacterProcessor:
                 original_data_greetings = original_data_obj.get('alternate_greetings', [])
                 
                 # Check if greetings arrays are identical and root actually HAS them
-                if (isinstance(original_root_greetings, list) and 
+                if (isinstance(original_root_greetings, list) and
                     len(original_root_greetings) == len(original_data_greetings) and
                     'alternate_greetings' in translated_data and
-                    all(self.fields_are_identical(str(r), str(d)) for r, d in zip(original_root_greetings, original_data_greetings))):
+                    tuple(_sig(str(r)) for r in original_root_greetings) ==
+                        tuple(_sig(str(d)) for d in original_data_greetings)):
                     print(f"  Copying translated alternate greetings from root to data...")
                     data_obj['alternate_greetings'] = translated_data['alternate_greetings']
                 else:
                     if len(data_obj['alternate_greetings']) > 0:
                         print(f"  Translating {len(data_obj['alternate_greetings'])} data alternate greetings...")
-                    translated_greetings = []
-                    for greeting in data_obj['alternate_greetings']:
-                        if isinstance(greeting, str) and greeting.strip():
-                            if greeting in translation_cache:
-                                translated_greetings.append(translation_cache[greeting])
-                            else:
-                                translated_greeting = self.translate_text(greeting, char_name, 'alternate_greetings')
-                                translated_greetings.append(translated_greeting)
-                                translation_cache[greeting] = translated_greeting
-                        else:
-                            translated_greetings.append(greeting)
-                    data_obj['alternate_greetings'] = translated_greetings
+                    data_obj['alternate_greetings'] = self._translate_greeting_list(
+                        data_obj['alternate_greetings'], char_name, translation_cache)
             
             # Handle extensions.depth_prompt.prompt
             if ('extensions' in data_obj and 
@@ -607,34 +1221,43 @@ class CharacterProcessor:
             if 'spec_version' not in translated_data:
                 translated_data['spec_version'] = '2.0'
             
-            # Encode data as base64
-            json_str = json.dumps(translated_data, ensure_ascii=False, separators=(',', ':'))
-            b64_data = base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
+            # Encode data as base64, serializing straight to bytes so no
+            # intermediate str copy of the payload is made
+            if orjson is not None:
+                payload = orjson.dumps(translated_data)  # compact by default
+            else:
+                payload = json.dumps(translated_data, ensure_ascii=False,
+                                     separators=(',', ':')).encode('utf-8')
+            b64_data = base64.b64encode(payload).decode('ascii')
             
-            # Open original image and save with new metadata
-            with Image.open(original_file) as img:
-                # Create new metadata
-                metadata = PngInfo()
-                metadata.add_text("chara", b64_data)
-                metadata.add_text("Ccv3", b64_data) 
-                
-                # Copy other existing metadata if present (except chara and Ccv3)
-                if hasattr(img, 'text'):
-                    for key, value in img.text.items():
-                        if key not in ['chara', 'Ccv3']:  # Don't copy old chara/Ccv3 data
-                            metadata.add_text(key, value)
-                
-                # Save to characters directory
-                characters_dir = Path(self.config.characters_dir)
-                output_path = characters_dir / original_file.name
-                
-                # Ensure output directory exists
-                characters_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Save with new metadata
-                img.save(output_path, "PNG", pnginfo=metadata)
-                
-                print(f"{Fore.GREEN}✓ Translated card saved: {output_path.name}{Style.RESET_ALL}")
+            # Save to characters directory
+            characters_dir = Path(self.config.characters_dir)
+            output_path = characters_dir / original_file.name
+
+            # Ensure output directory exists (memoized, runs once per dir)
+            ensure_dir(characters_dir)
+
+            try:
+                # Splice the metadata chunks directly; the pixel data is
+                # copied verbatim instead of being re-encoded through libpng
+                _rewrite_png_text(original_file, output_path,
+                                  {"chara": b64_data, "Ccv3": b64_data})
+            except Exception:
+                # Not a parseable PNG: fall back to a full PIL re-encode
+                with Image.open(original_file) as img:
+                    metadata = PngInfo()
+                    metadata.add_text("chara", b64_data)
+                    metadata.add_text("Ccv3", b64_data)
+
+                    # Copy other existing metadata if present (except chara and Ccv3)
+                    if hasattr(img, 'text'):
+                        for key, value in img.text.items():
+                            if key not in ['chara', 'Ccv3']:  # Don't copy old chara/Ccv3 data
+                                metadata.add_text(key, value)
+
+                    img.save(output_path, "PNG", pnginfo=metadata)
+
+            print(f"{Fore.GREEN}✓ Translated card saved: {output_path.name}{Style.RESET_ALL}")
                 
         except Exception as e:
             print(f"{Fore.RED}✗ Error saving translated card {original_file.name}: {e}{Style.RESET_ALL}")
@@ -680,10 +1303,80 @@ class CharacterProcessor:
         # Save translated card
         self.save_translated_card(original_file, translated_data)
         
-        # Update database
-        self.db[original_file.name] = file_hash
-        self.save_db()
+        # Update database and flush new memo entries
+        with self._db_lock:
+            self.db[original_file.name] = file_hash
+            self.save_db_entry(original_file.name, file_hash)
+        self.save_memo()
     
+    def _collect_card_texts(self, char_data: Dict, char_name: Optional[str]) -> list:
+        """Collect the strings translate_text would dispatch for a card.
+
+        Preparation (short-text/placeholder skips and {{char}}
+        substitution) mirrors translate_text so the memo keys line up
+        when the Batch API pre-warms the memo.
+        """
+        candidates = []  # (text, substitute_char_name)
+        data_obj = char_data.get('data')
+        for source in (char_data, data_obj if isinstance(data_obj, dict) else None):
+            if not source:
+                continue
+            for field in ('description', 'personality', 'scenario', 'first_mes',
+                          'mes_example', 'creator_notes', 'system_prompt',
+                          'post_history_instructions'):
+                candidates.append((source.get(field), True))
+            if self.config.translate_names:
+                # name goes through translate_text without char substitution
+                candidates.append((source.get('name'), False))
+            if self.config.translate_greetings:
+                greetings = source.get('alternate_greetings')
+                if isinstance(greetings, list):
+                    candidates.extend((g, True) for g in greetings)
+
+        texts = []
+        for text, substitute in candidates:
+            if not text or not isinstance(text, str):
+                continue
+            if len(text.strip()) < 3 or text.strip() in _PLACEHOLDERS:
+                continue
+            if substitute and char_name and self.config.use_char_name:
+                text = _CHAR_RE.sub(lambda _: char_name, text)
+            texts.append(text)
+        return texts
+
+    def _prewarm_memo_via_batch(self, files: list):
+        """Translate every new string through the Batch API before the
+        per-card pass, which then resolves fields from the memo instead of
+        issuing synchronous LLM calls. Batch jobs cost roughly half as
+        much but can take hours, hence the opt-in config flag."""
+        lang = self.config.target_lang
+        pending = {}
+        for file_path in files:
+            char_data = self.extract_character_data(file_path)
+            if not char_data:
+                continue
+            char_name = None
+            if isinstance(char_data, dict):
+                char_name = char_data.get('name') or char_data.get('data', {}).get('name')
+            for text in self._collect_card_texts(char_data, char_name):
+                key = _memo_key(text, lang)
+                if key not in self.memo and key not in pending:
+                    pending[key] = text
+
+        if not pending:
+            return
+        print(f"{Fore.BLUE}📤 Dispatching {len(pending)} strings through the Batch API "
+              f"(this can take a while)...{Style.RESET_ALL}")
+        keys = list(pending)
+        texts = [pending[k] for k in keys]
+        translated = self.translator.batch_translate(texts, lang)
+        with self._db_lock:
+            for key, text, result in zip(keys, texts, translated):
+                if result and result != text:
+                    self.memo[key] = result
+                    self._memo_dirty = True
+        self.save_memo()
+
     def process_existing_files(self):
         """Process all existing files in directory"""
         characters_dir = Path(self.config.characters_dir)
@@ -691,38 +1384,49 @@ class CharacterProcessor:
             print(f"{Fore.RED}Characters directory does not exist!{Style.RESET_ALL}")
             return
         
-        png_files = list(characters_dir.glob('*.png'))
-        if not png_files:
+        # Single scandir pass: count files and collect the new ones not in
+        # database; known names are skipped without any stat or Path object
+        total_found = 0
+        files_to_process = []
+        for entry in _iter_pngs(characters_dir):
+            total_found += 1
+            if os.fsdecode(entry.name) not in self.db:
+                files_to_process.append(Path(os.fsdecode(entry.path)))
+
+        if not total_found:
             print(f"{Fore.YELLOW}No PNG files found in directory{Style.RESET_ALL}")
             return
-            
-        print(f"{Fore.BLUE}📁 Found {len(png_files)} PNG files{Style.RESET_ALL}")
-        
-        # Filter files that need processing (only new files not in database)
-        files_to_process = []
-        for file_path in png_files:
-            try:
-                if file_path.name not in self.db:
-                    files_to_process.append(file_path)
-            except Exception as e:
-                print(f"{Fore.RED}✗ Error checking {file_path.name}: {e}{Style.RESET_ALL}")
-        
+
+        print(f"{Fore.BLUE}📁 Found {total_found} PNG files{Style.RESET_ALL}")
+
         if not files_to_process:
             print(f"{Fore.GREEN}✓ All files are already in translation database{Style.RESET_ALL}")
             return
             
         print(f"{Fore.BLUE}🔄 Processing {len(files_to_process)} new files not yet translated...{Style.RESET_ALL}")
-        
-        processed = 0
-        for file_path in files_to_process:
-            try:
-                self.process_character(file_path)
-                processed += 1
-            except Exception as e:
-                print(f"{Fore.RED}✗ Error processing {file_path.name}: {e}{Style.RESET_ALL}")
-        
+
+        # Optional pre-pass: push all new strings through the provider's
+        # Batch API so the per-card loop is served from the memo
+        if (self.config.service == "llm" and self.config.use_batch_api
+                and isinstance(self.translator, LLMTranslator)):
+            self._prewarm_memo_via_batch(files_to_process)
+
+        # Cards are network-bound, so run a few of them concurrently
+        max_workers = max(1, self.config.max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            processed = sum(executor.map(self._safe_process, files_to_process))
+
         print(f"{Fore.GREEN}✅ Completed processing {processed}/{len(files_to_process)} files{Style.RESET_ALL}")
 
+    def _safe_process(self, file_path: Path) -> bool:
+        """process_character wrapper that is safe to run on worker threads"""
+        try:
+            self.process_character(file_path)
+            return True
+        except Exception as e:
+            print(f"{Fore.RED}✗ Error processing {file_path.name}: {e}{Style.RESET_ALL}")
+            return False
+
     def translate_personas(self):
         """Translate character personas in settings.json"""
         settings_path = self.settings_file
@@ -761,11 +1465,25 @@ class CharacterProcessor:
 
             self.config.personas_translated = True
             self.save_config()
+            self.save_memo()
             print(f"{Fore.GREEN}✅ Personas translated successfully!{Style.RESET_ALL}")
 
         except Exception as e:
             print(f"{Fore.RED}❌ Error translating personas: {e}{Style.RESET_ALL}")
 
+    def restore_originals(self) -> int:
+        """Move backed-up originals over their translated counterparts"""
+        count = 0
+        for backup_file in _iter_pngs(self.original_dir):
+            target_file = Path(self.config.characters_dir) / os.fsdecode(backup_file.name)
+            try:
+                # os.replace() will overwrite existing files
+                os.replace(backup_file.path, target_file)
+                count += 1
+            except Exception as e:
+                print(f"{Fore.RED}Error restoring {os.fsdecode(backup_file.name)}: {e}{Style.RESET_ALL}")
+        return count
+
     def restore_personas(self):
         """Restore original personas from backup"""
         settings_path = self.settings_file
@@ -789,34 +1507,90 @@ class CharacterProcessor:
             print(f"{Fore.RED}❌ Error restoring personas: {e}{Style.RESET_ALL}")
 
 class FileHandler(FileSystemEventHandler):
-    """File system event handler"""
-    
+    """File system event handler with debouncing.
+
+    on_created/on_moved/on_modified can each fire several times while a
+    file is still being copied in. Events are coalesced into a pending map
+    and a background thread only submits a file for processing once it has
+    been quiet for a full debounce window and its size is stable across
+    two checks, guaranteeing exactly-once handling per file.
+    """
+
+    _SCAN_INTERVAL = 0.25
+    _QUIET_WINDOW = 1.0
+
     def __init__(self, processor: CharacterProcessor):
         self.processor = processor
-        
+        self._pending: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Bulk copies settle many files in the same scan tick; process the
+        # batch in parallel rather than one card at a time
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, processor.config.max_workers))
+        self._scanner = threading.Thread(target=self._scan_pending, daemon=True)
+        self._scanner.start()
+
+    def stop(self):
+        """Stop the scanner thread and release the worker pool.
+
+        Without this every start/stop monitoring cycle would leak one
+        scanner thread plus an idle executor.
+        """
+        self._stop_event.set()
+        self._scanner.join(timeout=2 * self._SCAN_INTERVAL)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def on_created(self, event):
         if not event.is_directory and event.src_path.endswith('.png'):
-            self._handle_new_file(event.src_path)
-    
+            self._mark(event.src_path)
+
     def on_moved(self, event):
         if not event.is_directory and event.dest_path.endswith('.png'):
-            self._handle_new_file(event.dest_path)
-    
+            self._mark(event.dest_path)
+
     def on_modified(self, event):
         if not event.is_directory and event.src_path.endswith('.png'):
-            # Check if it's a new file (not in database)
-            file_path = Path(event.src_path)
-            if file_path.name not in self.processor.db:
-                self._handle_new_file(event.src_path)
-    
+            self._mark(event.src_path)
+
+    def _mark(self, path_str):
+        """Record (or refresh) a pending event for a not-yet-known file"""
+        if Path(path_str).name in self.processor.db:
+            return
+        with self._lock:
+            self._pending[path_str] = time.monotonic()
+
+    def _scan_pending(self):
+        """Drain pending events whose files have gone quiet and stable"""
+        while not self._stop_event.wait(self._SCAN_INTERVAL):
+            now = time.monotonic()
+            due = []
+            with self._lock:
+                for path_str, last_event in list(self._pending.items()):
+                    if now - last_event < self._QUIET_WINDOW:
+                        continue
+                    try:
+                        size = os.path.getsize(path_str)
+                    except OSError:
+                        # vanished mid-copy; forget it
+                        self._pending.pop(path_str, None)
+                        self._sizes.pop(path_str, None)
+                        continue
+                    if self._sizes.get(path_str) == size:
+                        self._pending.pop(path_str, None)
+                        self._sizes.pop(path_str, None)
+                        due.append(path_str)
+                    else:
+                        self._sizes[path_str] = size
+            if len(due) == 1:
+                self._handle_new_file(due[0])
+            elif due:
+                list(self._executor.map(self._handle_new_file, due))
+
     def _handle_new_file(self, file_path_str):
         """Handle new PNG file detection"""
         file_path = Path(file_path_str)
-        
-        # Small delay to ensure file is fully written
-        time.sleep(2)
-        
-        # Check if file still exists and is not in database
         if file_path.exists() and file_path.name not in self.processor.db:
             print(f"{Fore.CYAN}🔔 New file detected: {file_path.name}{Style.RESET_ALL}")
             try:
@@ -824,6 +1598,32 @@ class FileHandler(FileSystemEventHandler):
             except Exception as e:
                 print(f"{Fore.RED}✗ Error processing new file {file_path.name}: {e}{Style.RESET_ALL}")
 
+def start_monitoring(processor: CharacterProcessor):
+    """Run a one-shot catch-up scan, then rely solely on watchdog events"""
+    print(f"{Fore.BLUE}🔍 Starting monitoring of {processor.config.characters_dir}{Style.RESET_ALL}")
+
+    # Reconcile existing files exactly once at startup; after this the
+    # observer is the only change-detection mechanism (no periodic rescan)
+    processor.process_existing_files()
+
+    print(f"{Fore.BLUE}👀 Now monitoring for new files... (Place PNG files in the directory){Style.RESET_ALL}")
+    print(f"{Fore.RED}Press Ctrl+C to stop monitoring{Style.RESET_ALL}")
+
+    observer = Observer()
+    event_handler = FileHandler(processor)
+    observer.schedule(event_handler, processor.config.characters_dir, recursive=False)
+    observer.start()
+
+    try:
+        # Block on the observer thread itself instead of a polling loop,
+        # so the process idles completely between events
+        observer.join()
+    except KeyboardInterrupt:
+        observer.stop()
+        event_handler.stop()
+        print(f"\n{Fore.YELLOW}Monitoring stopped{Style.RESET_ALL}")
+        observer.join()
+
 def show_current_status(processor: CharacterProcessor):
     """Show current translation settings in a compact format"""
     print(f"\n{Fore.BLUE}=== Current Settings ==={Style.RESET_ALL}")
@@ -893,6 +1693,7 @@ def configure_settings(processor: CharacterProcessor):
                 api_key = processor.config.nanogpt_api_key
                 
             print(f"9. {processor.config.provider.capitalize()} API Key: {'Set' if api_key else 'Not set'}")
+            print(f"B. Use Batch API for bulk runs: {processor.config.use_batch_api}")
         print("10. Back to main menu")
         
         choice = input(f"\n{Fore.GREEN}Choose option: {Style.RESET_ALL}").strip()
@@ -911,7 +1712,7 @@ def configure_settings(processor: CharacterProcessor):
                         # It's SillyTavern root, use the characters subdirectory
                         processor.config.characters_dir = str(possible_chars_dir)
                         print(f"{Fore.GREEN}✓ Found SillyTavern characters directory: {possible_chars_dir}{Style.RESET_ALL}")
-                    elif dir_path.name == 'characters' or any(f.suffix == '.png' for f in dir_path.glob('*.png')):
+                    elif dir_path.name == 'characters' or next(dir_path.glob('*.png'), None) is not None:
                         # It's likely the characters directory itself
                         processor.config.characters_dir = str(dir_path)
                         print(f"{Fore.GREEN}✓ Using characters directory: {dir_path}{Style.RESET_ALL}")
@@ -995,6 +1796,11 @@ def configure_settings(processor: CharacterProcessor):
             processor.translator = processor.setup_translator()
             processor.save_config()
             
+        elif choice.lower() == "b" and processor.config.service == "llm":
+            print("Batch jobs cost roughly half as much but can take up to 24h to complete.")
+            processor.config.use_batch_api = input("Use the Batch API for bulk processing? (y/n): ").lower().startswith('y')
+            processor.save_config()
+
         elif choice == "10":
             break
 
@@ -1044,28 +1850,8 @@ def main():
                     print(f"{Fore.RED}Please configure {processor.config.provider.capitalize()} API key first!{Style.RESET_ALL}")
                     continue
                 
-            print(f"{Fore.BLUE}🔍 Starting monitoring of {processor.config.characters_dir}{Style.RESET_ALL}")
-            
-            # Process existing files first
-            processor.process_existing_files()
-            
-            print(f"{Fore.BLUE}👀 Now monitoring for new files... (Place PNG files in the directory){Style.RESET_ALL}")
-            print(f"{Fore.RED}Press Ctrl+C to stop monitoring{Style.RESET_ALL}")
-            
-            observer = Observer()
-            event_handler = FileHandler(processor)
-            observer.schedule(event_handler, processor.config.characters_dir, recursive=False)
-            observer.start()
-            
-            try:
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                observer.stop()
-                print(f"\n{Fore.YELLOW}Monitoring stopped{Style.RESET_ALL}")
-            
-            observer.join()
-            
+            start_monitoring(processor)
+
         elif choice == "2":
             processor.translate_personas()
 
@@ -1079,21 +1865,13 @@ def main():
             processor.restore_personas()
 
         elif choice == "6":
-            # Restore originals
-            count = 0
-            for backup_file in processor.original_dir.glob('*.png'):
-                target_file = Path(processor.config.characters_dir) / backup_file.name
-                try:
-                    # os.replace() will overwrite existing files
-                    os.replace(backup_file, target_file)
-                    count += 1
-                except Exception as e:
-                    print(f"{Fore.RED}Error restoring {backup_file.name}: {e}{Style.RESET_ALL}")
+            count = processor.restore_originals()
             print(f"{Fore.GREEN}Restored {count} original files{Style.RESET_ALL}")
                     
         elif choice == "7":
-            processor.db.clear()
-            processor.save_db()
+            with processor._db_lock:
+                processor.db.clear()
+                processor.save_db()
             print(f"{Fore.GREEN}Database cleared{Style.RESET_ALL}")
             
         elif choice == "8":
@@ -1,55 +1,240 @@
+import atexit
 import json
 import re
 import os
+import random
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
 from deep_translator import GoogleTranslator as Translator
 from groq import Groq, APIError as GroqAPIError
 from openai import OpenAI, APIError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CONFIG_FILE = "./config.json"
 LANGUAGES_FILE = "./lang/lang_data.json"
+CACHE_DB_FILE = "./cache/translations.db"
 MAX_CHUNK_CHAR_LIMIT = 4500
 
-TARGET_FIELDS = {
+TARGET_FIELDS = frozenset({
     "content", "new_group_chat_prompt", "new_example_chat_prompt",
     "continue_nudge_prompt", "wi_format", "personality_format",
     "group_nudge_prompt", "scenario_format", "new_chat_prompt",
     "impersonation_prompt", "bias_preset_selected", "assistant_impersonation",
     "assistant_prefill"
-}
-
-CODE_BLOCK_PLACEHOLDER_PREFIX = "__CODE_BLOCK_"
-INLINE_CODE_PLACEHOLDER_PREFIX = "__INLINE_CODE_"
+})
+
+# In-memory translation memo size; oldest entries are evicted past this
+MEMO_MAX_ENTRIES = 2048
+
+# Upper bound on source characters packed into one batched request
+MAX_BATCH_CHARS = 3000
+
+# Sentinel used to pack several short strings into one Google request;
+# the lenient split pattern tolerates whitespace the service may inject
+_GOOGLE_BATCH_SEP = "\n@@SEP@@\n"
+_GOOGLE_SEP_RE = re.compile(r'\s*@@\s*SEP\s*@@\s*', re.IGNORECASE)
+
+# Shared HTTP client so LLM calls reuse pooled connections instead of
+# paying a TCP+TLS handshake per request (http2 would need the optional
+# h2 extra, so plain keep-alive pooling is used). Sized for the worker
+# pool plus batched requests; closed when the interpreter exits.
+_HTTP_CLIENT = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    timeout=90.0,
+)
+atexit.register(_HTTP_CLIENT.close)
+
+# Placeholders are bracketed with high-BMP delimiters that translators
+# pass through as unknown tokens; the old __CODE_BLOCK_N style was prone
+# to being case-mangled or split with spaces, breaking restoration
+CODE_BLOCK_PLACEHOLDER_PREFIX = "⟦CB"
+INLINE_CODE_PLACEHOLDER_PREFIX = "⟦IC"
+PLACEHOLDER_SUFFIX = "⟧"
 VAR_PLACEHOLDERS = {"{{char}}": "Jane", "{{user}}": "James"}
 REVERSED_VAR_PLACEHOLDERS = {v: k for k, v in VAR_PLACEHOLDERS.items()}
 
+# One alternation per direction so variable placeholders are swapped in a
+# single scan rather than one str.replace walk per entry; the forward
+# pattern captures just the variable name for a direct map lookup
+_VAR_RE = re.compile(r'\{\{(char|user)\}\}')
+_VAR_MAP = {key[2:-2]: value for key, value in VAR_PLACEHOLDERS.items()}
+_RVAR_RE = re.compile("|".join(re.escape(k) for k in REVERSED_VAR_PLACEHOLDERS))
+
+# Patterns compiled once at import; these run on every field of every file
+_TRIPLE_BACKTICK_PATTERN = r'```(?:[^\n]*?\n)?[\s\S]*?\n```'
+_INLINE_BACKTICK_PATTERN = r'`[^`\n]+`'
+_CODE_RE = re.compile(f"({_TRIPLE_BACKTICK_PATTERN})|({_INLINE_BACKTICK_PATTERN})")
+
+# Post-processing runs in three scans: strip space before [.,;:], then a
+# fused pass that inserts missing spaces after punctuation and uppercases
+# sentence starts (consuming the glued letter so both fixes land at once),
+# then whitespace collapsing. Verified byte-identical to the previous
+# five sequential passes.
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.,;:])')
+_POSTPROC_RE = re.compile(
+    r'(?P<b>[.,;:!?])(?:(?P<b2>[a-z])|(?=[^\s\)\}\]]))'
+    r'|(?P<d>[.!?])(?P<d3>\s+)(?P<d4>[a-z])'
+)
+_MULTISPACE_RE = re.compile(r' +')
+
+def _postproc_fix(m):
+    b = m.group('b')
+    if b is not None:
+        letter = m.group('b2')
+        if letter is not None:
+            return b + ' ' + (letter.upper() if b in '.!?' else letter)
+        return b + ' '
+    return m.group('d') + m.group('d3') + m.group('d4').upper()
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_WS_RUN_RE = re.compile(r'\s+')
+_ITEM_MARK_RE = re.compile(r'###\s*ITEM\s+(\d+)\s*\n?')
+_PROTECTED_PH_RE = re.compile(r'⟦(?:CB|IC)\d+⟧')
+_PH_ONLY_RE = _PROTECTED_PH_RE
+
+def _normalize_for_cache(text):
+    """Fold whitespace runs and case so cosmetic edits share cache hits."""
+    return _WS_RUN_RE.sub(' ', text).strip().lower()
+
+_ANGLE_INSTRUCTIONS = {
+    True: "Translate any text wrapped inside angle braces (<...>) normally.",
+    False: "Keep all content inside angle braces (<...>) exactly as provided. Do NOT translate them.",
+}
+
+_REASONING_RE = re.compile(r'<\w+>[\s\S]*?<\/\w+>', re.IGNORECASE)
+_FENCE_OPEN_RE = re.compile(r'^```(\w+)?\n')
+_FENCE_CLOSE_RE = re.compile(r'\n```$')
+_LEADING_NOISE_RE = re.compile(r'^(?:\r?\n|---)*')
+_TRAILING_NOISE_RE = re.compile(r'(?:\r?\n|---)*$')
+
+_TRANSIENT_STATUS = {408, 429, 500, 502, 503, 504}
+
+def _is_transient_error(exc):
+    """True for rate limits, timeouts and flaky-connection failures."""
+    if getattr(exc, 'status_code', None) in _TRANSIENT_STATUS:
+        return True
+    if isinstance(exc, httpx.HTTPError):
+        return True
+    message = str(exc).lower()
+    return any(token in message for token in
+               ('429', 'too many requests', 'timeout', 'temporarily', 'connection'))
+
+def _retry_transient(call, attempts=4):
+    """Run call(), retrying transient failures with backoff and jitter.
+
+    Permanent errors (auth, bad request) are raised immediately so they
+    are not papered over; jitter keeps parallel workers from hammering a
+    rate-limited endpoint in lockstep.
+    """
+    delay = 1.0
+    for attempt in range(attempts):
+        try:
+            return call()
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_transient_error(e):
+                raise
+            wait = min(delay, 20) * (0.5 + random.random())
+            print(f"Transient translation error ({e}); retrying in {wait:.1f}s...")
+            time.sleep(wait)
+            delay *= 2
+
+def _split_long(text, chunk_size):
+    """Split text into chunks of at most chunk_size, breaking on spaces.
+
+    Slices at the last space before the limit via str.rfind instead of
+    accumulating word-by-word, so splitting stays linear in text length.
+    """
+    out, i, n = [], 0, len(text)
+    while i < n:
+        end = min(i + chunk_size, n)
+        if end < n:
+            brk = text.rfind(' ', i, end)
+            if brk > i:
+                end = brk
+        out.append(text[i:end])
+        i = end + 1 if end < n and text[end] == ' ' else end
+    return out
+
 def load_json_safe(filepath, default=None):
     """Loads a JSON file safely, returning a default value on error."""
     try:
         if not os.path.exists(filepath):
             return default if default is not None else {}
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
+    except (ValueError, OSError) as e:
         print(f"Error loading JSON from {filepath}: {e}. Returning default.")
         return default if default is not None else {}
 
+# Directories save_json has already ensured exist this run
+_CREATED_DIRS = set()
+
 def save_json(filepath, data):
-    """Saves data to a JSON file, creating directories if needed."""
+    """Saves data to a JSON file atomically, creating directories if needed.
+
+    The payload is written to a sibling .tmp file, fsynced and then
+    os.replace()d over the destination, so a crash mid-write can never
+    leave a truncated character file behind.
+    """
+    tmp_path = filepath + ".tmp"
     try:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        dirname = os.path.dirname(filepath)
+        if dirname and dirname not in _CREATED_DIRS:
+            os.makedirs(dirname, exist_ok=True)
+            _CREATED_DIRS.add(dirname)
+        if orjson is not None:
+            # orjson emits UTF-8 directly; its only indent option is 2
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            buf = json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+        with open(tmp_path, 'wb') as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
         return True
-    except (IOError, OSError) as e:
+    except (IOError, OSError, TypeError) as e:
         print(f"Error saving JSON to {filepath}: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
         return False
 
+# Parsed language data keyed by (path, mtime_ns, size); the file is
+# static, so repeated TranslationConfig constructions skip the re-parse
+_LANG_CACHE = {}
+
+def _load_lang_data():
+    try:
+        st = os.stat(LANGUAGES_FILE)
+        key = (LANGUAGES_FILE, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return {"languages": {"en": "English"}}
+    if key not in _LANG_CACHE:
+        _LANG_CACHE.clear()
+        _LANG_CACHE[key] = load_json_safe(LANGUAGES_FILE, {"languages": {"en": "English"}})
+    return _LANG_CACHE[key]
+
 class TranslationConfig:
     """Manages application configuration and language settings."""
     def __init__(self):
         self.data = self._load_or_create_config()
-        lang_data = load_json_safe(LANGUAGES_FILE, {"languages": {"en": "English"}})
+        self._saved_snapshot = json.dumps(self.data, sort_keys=True)
+        lang_data = _load_lang_data()
         self.languages = lang_data.get("languages", {"en": "English"})
+        self._name_to_code = {name: code for code, name in self.languages.items()}
         self.current_lang = self.data.get("last_used_language", "en")
         if self.current_lang not in self.languages:
             self.current_lang = "en"
@@ -65,88 +250,215 @@ class TranslationConfig:
         }
         loaded_config = load_json_safe(CONFIG_FILE)
         config = {**defaults, **loaded_config}
-        if not loaded_config or any(key not in loaded_config for key in defaults):
+        # Only touch the file when defaults were actually merged in; a
+        # stable mtime keeps file watchers from re-triggering on startup
+        missing = [key for key in defaults if key not in loaded_config]
+        if missing:
+            if loaded_config:
+                print(f"Added missing config defaults: {', '.join(missing)}")
             save_json(CONFIG_FILE, config)
         return config
 
     def save(self):
-        save_json(CONFIG_FILE, self.data)
+        snapshot = json.dumps(self.data, sort_keys=True)
+        if snapshot == self._saved_snapshot:
+            return
+        if save_json(CONFIG_FILE, self.data):
+            self._saved_snapshot = snapshot
 
     def get_lang_code(self, native_name):
-        return next((code for code, name in self.languages.items() if name == native_name), None)
+        return self._name_to_code.get(native_name)
 
     def get_native_name(self, code):
         return self.languages.get(code, "English")
 
+# Disk cache row cap; the oldest entries are pruned once it is exceeded
+CACHE_MAX_ROWS = 50000
+
+class TranslationCache:
+    """Persistent content-addressed cache of raw translations.
+
+    Re-running the same preset costs a SQLite lookup per string instead of
+    a network round trip. Keys hash the provider, model, target language
+    and source text, so settings changes never return stale results.
+    """
+
+    def __init__(self, db_path=CACHE_DB_FILE):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        try:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, value TEXT, ts INTEGER)")
+            self._conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Translation cache unavailable: {e}")
+            self._conn = None
+
+    @staticmethod
+    def make_key(provider, model, target, text):
+        return hashlib.sha256(f"{provider}|{model}|{target}|{text}".encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        if not self._conn:
+            return None
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT value FROM translations WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                return None
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return row[0] if row else None
+
+    def put(self, key, value):
+        if not self._conn:
+            return
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO translations (key, value, ts) VALUES (?, ?, ?)",
+                    (key, value, int(time.time())))
+                self._puts += 1
+                # Prune the oldest rows occasionally so the cache file
+                # cannot grow without bound across sessions
+                if self._puts % 256 == 0:
+                    self._conn.execute(
+                        "DELETE FROM translations WHERE key IN ("
+                        "SELECT key FROM translations ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+                        (CACHE_MAX_ROWS,))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Translation cache write failed: {e}")
+
+    def log_stats(self):
+        """Print a hit/miss summary for cache tuning; silent when unused."""
+        if self.hits or self.misses:
+            total = self.hits + self.misses
+            print(f"Translation cache: {self.hits}/{total} hits this session.")
+
 class TranslationEngine:
     """Handles text chunking, translation, and formatting preservation."""
     def __init__(self):
-        self.google_translator = Translator(source='auto', target='en')
         self.openrouter_client = None
         self.groq_client = None
         self.nanogpt_client = None
+        # deep_translator's GoogleTranslator mutates .target per call, so
+        # pool workers each get their own instance via thread-local storage
+        self._local = threading.local()
+        self._client_init_lock = threading.Lock()
+        self._cache = TranslationCache()
+        atexit.register(self._cache.log_stats)
+        # Memoizes finished translations so repeated strings (boilerplate
+        # shared between fields or files) cost one request, not many
+        self._memo = {}
+        # Near-match layer: keys normalized for whitespace/case, consulted
+        # only when the exact memo and disk cache both miss
+        self._memo_normalized = {}
+        self._memo_lock = threading.Lock()
+        # The prompt only varies with the angle-brace policy; build both
+        # variants once and fill the target/text slots per call
+        self._prompt_templates = {
+            flag: (
+                "You are a high-precision translation engine. Your sole task is to translate the provided text into {target}.\n\n"
+                "### STRICT RULES:\n"
+                "1. OUTPUT ONLY the translated text. No preamble, no meta-commentary, no 'Translation:', and no apologies.\n"
+                "2. " + instruction + "\n"
+                "3. ZERO HALLUCINATION: Do not add information, notes, labels, or content that does not exist in the source.\n"
+                "4. NO ADDED FORMATTING: Do NOT include horizontal rules (---) or any other separator that isn't in the original.\n"
+                "5. PRESERVE PLACEHOLDERS: Do NOT translate or modify anything inside {{{{ }}}} (e.g., {{{{char}}}}, {{{{user}}}}).\n"
+                "6. Maintain all original formatting (newlines, tabs, spaces).\n\n"
+                "### SOURCE TEXT:\n"
+                "{text}\n\n"
+                "### {target_upper} TRANSLATION:"
+            )
+            for flag, instruction in _ANGLE_INSTRUCTIONS.items()
+        }
+        batch_rule = (
+            "7. The source is a numbered batch: every item begins with a '### ITEM i' line. "
+            "Translate each item and repeat its '### ITEM i' line unchanged before the translation.\n"
+        )
+        self._batch_prompt_templates = {
+            flag: tmpl.replace("\n\n### SOURCE TEXT:", "\n" + batch_rule + "\n### SOURCE TEXT:")
+            for flag, tmpl in self._prompt_templates.items()
+        }
 
     def _extract_and_protect(self, text):
         protected_items = {}
-        text = text.replace("{{char}}", VAR_PLACEHOLDERS["{{char}}"])
-        text = text.replace("{{user}}", VAR_PLACEHOLDERS["{{user}}"])
-
-        triple_backtick_pattern = r'```(?:[^\n]*?\n)?[\s\S]*?\n```'
-        inline_backtick_pattern = r'`[^`\n]+`'
-        matches = list(re.finditer(f"({triple_backtick_pattern})|({inline_backtick_pattern})", text))
+        text = _VAR_RE.sub(lambda m: _VAR_MAP[m.group(1)], text)
 
-        for match in reversed(matches):
+        # Single left-to-right sub; the callback records each protected
+        # span as it assigns its placeholder
+        def _protect(match):
             is_block = match.group(1) is not None
             placeholder_prefix = CODE_BLOCK_PLACEHOLDER_PREFIX if is_block else INLINE_CODE_PLACEHOLDER_PREFIX
-            placeholder = f"{placeholder_prefix}{len(protected_items)}"
+            placeholder = f"{placeholder_prefix}{len(protected_items)}{PLACEHOLDER_SUFFIX}"
             protected_items[placeholder] = match.group(0)
-            text = text[:match.start()] + placeholder + text[match.end():]
+            return placeholder
+
+        text = _CODE_RE.sub(_protect, text)
         return text, protected_items
 
     def _restore_protected(self, text, protected_items):
-        # Sort placeholders by length descending to avoid partial replacement (e.g., _1 vs _10)
-        for placeholder in sorted(protected_items.keys(), key=len, reverse=True):
-            text = text.replace(placeholder, protected_items[placeholder])
-        for placeholder_val, original_key in REVERSED_VAR_PLACEHOLDERS.items():
-            text = text.replace(placeholder_val, original_key)
+        if protected_items:
+            # Delimited tokens can't partially overlap, so one precompiled
+            # pass restores them all; unknown tokens are left untouched
+            text = _PROTECTED_PH_RE.sub(
+                lambda m: protected_items.get(m.group(0), m.group(0)), text)
+        text = _RVAR_RE.sub(lambda m: REVERSED_VAR_PLACEHOLDERS[m.group(0)], text)
         return text
 
     def _post_process_formatting(self, text):
-        text = re.sub(r'\s+([.,;:])', r'\1', text)
-        text = re.sub(r'([.,;:])(?=[^\s\)\}\]])', r'\1 ', text)
-        text = re.sub(r'([.!?])(?=[^\s\)\}\]])', r'\1 ', text)
-        text = re.sub(r'([.!?]\s+)([a-z])', lambda m: m.group(1) + m.group(2).upper(), text)
-        text = re.sub(r' +', ' ', text)
+        text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
+        text = _POSTPROC_RE.sub(_postproc_fix, text)
+        text = _MULTISPACE_RE.sub(' ', text)
         return text.strip()
 
+    def _get_google_translator(self, target_lang_code):
+        translator = getattr(self._local, 'google_translator', None)
+        if translator is None:
+            translator = Translator(source='auto', target=target_lang_code)
+            self._local.google_translator = translator
+        else:
+            translator.target = target_lang_code
+        return translator
+
     def _initialize_llm_clients(self, provider, api_key):
         try:
-            if provider == 'openrouter' and not self.openrouter_client and api_key:
-                self.openrouter_client = OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key)
-            elif provider == 'groq' and not self.groq_client and api_key:
-                self.groq_client = Groq(api_key=api_key)
-            elif provider == 'nanogpt' and not self.nanogpt_client and api_key:
-                self.nanogpt_client = OpenAI(base_url="https://nano-gpt.com/api/v1", api_key=api_key)
+            # Serialized so concurrent pool workers don't both construct a
+            # client for the same provider
+            with self._client_init_lock:
+                if provider == 'openrouter' and not self.openrouter_client and api_key:
+                    self.openrouter_client = OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key, http_client=_HTTP_CLIENT)
+                elif provider == 'groq' and not self.groq_client and api_key:
+                    self.groq_client = Groq(api_key=api_key, http_client=_HTTP_CLIENT)
+                elif provider == 'nanogpt' and not self.nanogpt_client and api_key:
+                    self.nanogpt_client = OpenAI(base_url="https://nano-gpt.com/api/v1", api_key=api_key, http_client=_HTTP_CLIENT)
         except Exception as e:
             print(f"Failed to initialize {provider} client: {e}")
 
     def _clean_llm_response(self, text):
-        reasoning_pattern = r'<\w+>[\s\S]*?<\/\w+>'
-        cleaned_text = re.sub(reasoning_pattern, '', text, flags=re.IGNORECASE)
-        cleaned_text = re.sub(r'^```(\w+)?\n', '', cleaned_text)
-        cleaned_text = re.sub(r'\n```$', '', cleaned_text)
+        cleaned_text = _REASONING_RE.sub('', text)
+        cleaned_text = _FENCE_OPEN_RE.sub('', cleaned_text)
+        cleaned_text = _FENCE_CLOSE_RE.sub('', cleaned_text)
         # Remove potential hallucinated indicators or horizontal rules at start/end
-        cleaned_text = re.sub(r'^(?:\r?\n|---)*', '', cleaned_text)
-        cleaned_text = re.sub(r'(?:\r?\n|---)*$', '', cleaned_text)
+        cleaned_text = _LEADING_NOISE_RE.sub('', cleaned_text)
+        cleaned_text = _TRAILING_NOISE_RE.sub('', cleaned_text)
         return cleaned_text.strip()
 
-    def _translate_with_llm(self, text, target_lang_name, llm_config, translate_angle):
-        """
-        Translates a text using the configured LLM provider with an improved prompt.
-        """
+    def _run_llm_prompt(self, prompt, llm_config):
+        """Dispatch a prompt to the configured provider and clean the reply."""
         provider = llm_config['provider']
         self._initialize_llm_clients(provider, llm_config['api_key'])
-        
+
         if provider == 'openrouter':
             client = self.openrouter_client
         elif provider == 'nanogpt':
@@ -157,29 +469,13 @@ class TranslationEngine:
         if not client:
             raise ValueError(f"{provider.capitalize()} client not initialized. Check API key.")
 
-        angle_instruction = "Translate any text wrapped inside angle braces (<...>) normally." if translate_angle else "Keep all content inside angle braces (<...>) exactly as provided. Do NOT translate them."
-
-        prompt = (
-            f"You are a high-precision translation engine. Your sole task is to translate the provided text into {target_lang_name}.\n\n"
-            f"### STRICT RULES:\n"
-            f"1. OUTPUT ONLY the translated text. No preamble, no meta-commentary, no 'Translation:', and no apologies.\n"
-            f"2. {angle_instruction}\n"
-            f"3. ZERO HALLUCINATION: Do not add information, notes, labels, or content that does not exist in the source.\n"
-            f"4. NO ADDED FORMATTING: Do NOT include horizontal rules (---) or any other separator that isn't in the original.\n"
-            f"5. PRESERVE PLACEHOLDERS: Do NOT translate or modify anything inside {{{{ }}}} (e.g., {{{{char}}}}, {{{{user}}}}).\n"
-            f"6. Maintain all original formatting (newlines, tabs, spaces).\n\n"
-            f"### SOURCE TEXT:\n"
-            f"{text}\n\n"
-            f"### {target_lang_name.upper()} TRANSLATION:"
-        )
-
         try:
-            completion = client.chat.completions.create(
+            completion = _retry_transient(lambda: client.chat.completions.create(
                 model=llm_config['model'],
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
                 timeout=90.0
-            )
+            ))
             raw_response = completion.choices[0].message.content
 
             if not raw_response:
@@ -193,43 +489,218 @@ class TranslationEngine:
                 raise ConnectionError(f"LLM request timed out after 90 seconds. Try a faster model or check your connection.")
             raise RuntimeError(f"An unexpected error occurred during LLM translation: {e}")
 
+    def _translate_with_llm(self, text, target_lang_name, llm_config, translate_angle):
+        """
+        Translates a text using the configured LLM provider with an improved prompt.
+        """
+        prompt = self._prompt_templates[bool(translate_angle)].format(
+            target=target_lang_name, target_upper=target_lang_name.upper(), text=text)
+        return self._run_llm_prompt(prompt, llm_config)
+
+    def _translate_batch_with_llm(self, texts, target_lang_name, llm_config, translate_angle):
+        """Translate several short texts with a single LLM request.
+
+        Items are delimited with '### ITEM i' marker lines in the prompt
+        and the model is asked to echo them back. Returns a list aligned
+        with texts, or None when the markers did not survive and the
+        caller should fall back to per-item requests.
+        """
+        joined = "\n\n".join(f"### ITEM {i}\n{t}" for i, t in enumerate(texts))
+        prompt = self._batch_prompt_templates[bool(translate_angle)].format(
+            target=target_lang_name, target_upper=target_lang_name.upper(), text=joined)
+        response = self._run_llm_prompt(prompt, llm_config)
+
+        parts = _ITEM_MARK_RE.split(response)
+        if len(parts) < 3:
+            return None
+        out = [None] * len(texts)
+        for idx_str, chunk in zip(parts[1::2], parts[2::2]):
+            idx = int(idx_str)
+            if 0 <= idx < len(texts) and out[idx] is None:
+                out[idx] = chunk.strip()
+        if any(item is None for item in out):
+            return None
+        return out
+
+    def _lookup_cached(self, processed_text, kwargs):
+        """Resolve one protected string through the memo, disk cache and
+        normalized-memo layers in that order.
+
+        Returns (raw_translation_or_None, (memo_key, cache_key, norm_key));
+        cache_key stays None on a memo hit, which tells _store_cached the
+        layers are already current."""
+        translate_angle = kwargs.get('translate_angle', False)
+        use_llm = bool(kwargs.get('use_llm') and kwargs.get('llm_config'))
+        llm_config = kwargs.get('llm_config') or {}
+
+        memo_key = (processed_text, kwargs.get('target_lang_code'), use_llm,
+                    llm_config.get('provider'), llm_config.get('model'), translate_angle)
+        with self._memo_lock:
+            hit = self._memo.get(memo_key)
+
+        cache_key = None
+        if hit is None:
+            if use_llm:
+                provider = llm_config.get('provider')
+                model = llm_config.get('model', '')
+                if translate_angle:
+                    model += '+angle'
+                target = kwargs.get('target_lang_name')
+            else:
+                provider, model, target = 'google', '', kwargs.get('target_lang_code')
+            cache_key = TranslationCache.make_key(provider, model, target, processed_text)
+            hit = self._cache.get(cache_key)
+
+        norm_key = (_normalize_for_cache(processed_text),) + memo_key[1:]
+        if hit is None:
+            with self._memo_lock:
+                hit = self._memo_normalized.get(norm_key)
+
+        return hit, (memo_key, cache_key, norm_key)
+
+    def _store_cached(self, keys, translation, from_network):
+        """Write a raw translation back through the cache layers."""
+        memo_key, cache_key, norm_key = keys
+        if cache_key is None:
+            return  # memo hit: every layer is already current
+        if from_network:
+            self._cache.put(cache_key, translation)
+        with self._memo_lock:
+            if len(self._memo) >= MEMO_MAX_ENTRIES:
+                self._memo.pop(next(iter(self._memo)))
+            self._memo[memo_key] = translation
+            if len(self._memo_normalized) >= MEMO_MAX_ENTRIES:
+                self._memo_normalized.pop(next(iter(self._memo_normalized)))
+            self._memo_normalized[norm_key] = translation
+
+    def _resolve_cached_items(self, protected, kwargs, results):
+        """Fill results with cache/memo hits for the protected items.
+
+        Returns {index: keys} for the misses that still need the network,
+        in input order."""
+        pending = {}
+        for i, (processed, items) in enumerate(protected):
+            hit, keys = self._lookup_cached(processed, kwargs)
+            if hit is not None:
+                self._store_cached(keys, hit, from_network=False)
+                results[i] = self._post_process_formatting(
+                    self._restore_protected(hit, items))
+            else:
+                pending[i] = keys
+        return pending
+
+    def _translate_texts_batch(self, texts, **kwargs):
+        """Translate a bucket of short strings via one coalesced LLM call,
+        degrading to per-text translate_text when the batch cannot be
+        parsed back apart. Cache and memo hits are resolved per item
+        first, so only the misses ride in the prompt and every parsed
+        result is written back through the same layers."""
+        protected = [self._extract_and_protect(t) for t in texts]
+        results = [None] * len(texts)
+        pending = self._resolve_cached_items(protected, kwargs, results)
+        if not pending:
+            return results
+
+        miss_indices = list(pending)
+        batched = None
+        try:
+            batched = self._translate_batch_with_llm(
+                [protected[i][0] for i in miss_indices],
+                kwargs['target_lang_name'], kwargs['llm_config'],
+                kwargs.get('translate_angle', False))
+        except Exception as e:
+            print(f"Batched LLM translation failed: {e}")
+
+        if batched is None:
+            for i in miss_indices:
+                results[i] = self.translate_text(texts[i], **kwargs)
+            return results
+
+        for i, raw in zip(miss_indices, batched):
+            self._store_cached(pending[i], raw, from_network=True)
+            results[i] = self._post_process_formatting(
+                self._restore_protected(raw, protected[i][1]))
+        return results
+
+    def _translate_texts_google_batch(self, texts, **kwargs):
+        """Translate a bucket of short strings in one sentinel-joined Google
+        request, degrading to per-text translate_text when the sentinel
+        does not survive translation. Like the LLM batch path, cache and
+        memo hits are resolved per item and only the misses go out."""
+        target_lang_code = kwargs['target_lang_code']
+        protected = [self._extract_and_protect(t) for t in texts]
+        results = [None] * len(texts)
+        pending = self._resolve_cached_items(protected, kwargs, results)
+        if not pending:
+            return results
+
+        miss_indices = list(pending)
+        try:
+            joined = _GOOGLE_BATCH_SEP.join(protected[i][0] for i in miss_indices)
+            raw = _retry_transient(
+                lambda: self._get_google_translator(target_lang_code).translate(text=joined))
+            parts = _GOOGLE_SEP_RE.split(raw) if raw else []
+            if len(parts) == len(miss_indices):
+                for i, part in zip(miss_indices, parts):
+                    self._store_cached(pending[i], part, from_network=True)
+                    results[i] = self._post_process_formatting(
+                        self._restore_protected(part, protected[i][1]))
+                return results
+        except Exception as e:
+            print(f"Batched Google translation failed: {e}")
+        for i in miss_indices:
+            results[i] = self.translate_text(texts[i], **kwargs)
+        return results
+
     def _translate_with_google(self, text, target_lang_code):
-        self.google_translator.target = target_lang_code
-        
-        # Split by sentences first
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        translated_chunks = []
-        current_chunk = ""
-
-        def translate_now(t):
-            if not t.strip(): return t
+        # Tokenize into sentences once and pack by running length; blank
+        # tokens are dropped here so no post-filter copy pass is needed
+        sentences = _SENT_SPLIT_RE.split(text.strip())
+        chunks = []
+        current_parts, current_len = [], 0
+
+        for sentence in sentences:
+            if not sentence or sentence.isspace():
+                continue
+            slen = len(sentence)
+            # If a single sentence is still too long, break it by itself
+            if slen > MAX_CHUNK_CHAR_LIMIT:
+                if current_parts:
+                    chunks.append(" ".join(current_parts))
+                    current_parts, current_len = [], 0
+
+                # Break the massive sentence on word boundaries
+                chunks.extend(_split_long(sentence, MAX_CHUNK_CHAR_LIMIT))
+            elif current_len + slen + 1 > MAX_CHUNK_CHAR_LIMIT and current_parts:
+                chunks.append(" ".join(current_parts))
+                current_parts, current_len = [sentence], slen + 1
+            else:
+                current_parts.append(sentence)
+                current_len += slen + 1
+
+        if current_parts:
+            chunks.append(" ".join(current_parts))
+
+        if not chunks:
+            return text
+
+        def translate_chunk(chunk):
             try:
-                # Add a bit of safety margin to the limit
-                return self.google_translator.translate(text=t.strip())
+                result = _retry_transient(
+                    lambda: self._get_google_translator(target_lang_code).translate(text=chunk))
+                return result if result else chunk
             except Exception as e:
                 print(f"Google Translate error: {e}")
-                return t # Fallback to original
+                return chunk # Fallback to original
 
-        for sentence in sentences:
-            # If a single sentence is still too long, break it by characters
-            if len(sentence) > MAX_CHUNK_CHAR_LIMIT:
-                if current_chunk:
-                    translated_chunks.append(translate_now(current_chunk))
-                    current_chunk = ""
-                
-                # Hard break the massive sentence
-                for i in range(0, len(sentence), MAX_CHUNK_CHAR_LIMIT):
-                    part = sentence[i:i + MAX_CHUNK_CHAR_LIMIT]
-                    translated_chunks.append(translate_now(part))
-            elif len(current_chunk) + len(sentence) > MAX_CHUNK_CHAR_LIMIT:
-                translated_chunks.append(translate_now(current_chunk))
-                current_chunk = sentence + " "
-            else:
-                current_chunk += sentence + " "
+        if len(chunks) == 1:
+            translated_chunks = [translate_chunk(chunks[0])]
+        else:
+            # Chunks are independent requests (translate_batch just loops
+            # over them serially), so overlap them on a small pool
+            with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as pool:
+                translated_chunks = list(pool.map(translate_chunk, chunks))
 
-        if current_chunk:
-            translated_chunks.append(translate_now(current_chunk))
-        
         return " ".join(translated_chunks).strip()
 
     def translate_text(self, text, **kwargs):
@@ -237,42 +708,128 @@ class TranslationEngine:
             return text
 
         processed_text, protected_items = self._extract_and_protect(text)
-        
+
+        # Nothing translatable left once the protected spans are removed
+        # (pure code fields); skip the network round trip entirely
+        if protected_items and not _PH_ONLY_RE.sub('', processed_text).strip():
+            return self._restore_protected(processed_text, protected_items)
+
         translate_angle = kwargs.get('translate_angle', False)
+        use_llm = bool(kwargs.get('use_llm') and kwargs.get('llm_config'))
+        llm_config = kwargs.get('llm_config') or {}
 
-        if kwargs.get('use_llm') and kwargs.get('llm_config'):
-            final_translation = self._translate_with_llm(processed_text, kwargs['target_lang_name'], kwargs['llm_config'], translate_angle)
-        else:
-            final_translation = self._translate_with_google(processed_text, kwargs['target_lang_code'])
+        # Identical strings under the same settings resolve from the memo,
+        # then the disk cache, then the normalized near-match memo
+        final_translation, keys = self._lookup_cached(processed_text, kwargs)
+
+        from_network = final_translation is None
+        if from_network:
+            if use_llm:
+                final_translation = self._translate_with_llm(processed_text, kwargs['target_lang_name'], llm_config, translate_angle)
+            else:
+                final_translation = self._translate_with_google(processed_text, kwargs['target_lang_code'])
+
+        self._store_cached(keys, final_translation, from_network)
 
         restored_text = self._restore_protected(final_translation, protected_items)
         return self._post_process_formatting(restored_text)
     
-    def translate_json_data(self, data, **kwargs):
-        items_to_translate = []
-        visited = set()
-
-        def find_items(current_data):
-            if id(current_data) in visited: return
-            visited.add(id(current_data))
-            
-            if isinstance(current_data, dict):
-                for key, value in current_data.items():
-                    if key in TARGET_FIELDS and isinstance(value, str) and value.strip():
-                        items_to_translate.append((current_data, key))
+    @staticmethod
+    def _iter_targets(root, track_cycles=False):
+        """Yield (container, key) pairs for translatable fields.
+
+        Iterative with an explicit stack, so arbitrarily nested presets
+        cannot hit the recursion limit and no call-frame overhead is paid
+        per container. Freshly parsed JSON is always a tree, so the
+        cycle/shared-subtree guard is opt-in.
+        """
+        target_fields = TARGET_FIELDS
+        visited = set() if track_cycles else None
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            if visited is not None:
+                if id(current) in visited:
+                    continue
+                visited.add(id(current))
+
+            if isinstance(current, dict):
+                for key, value in current.items():
+                    if key in target_fields and type(value) is str:
+                        # A target string can't also be a container, so the
+                        # isinstance check below is skipped for it
+                        if value.strip():
+                            yield current, key
                     elif isinstance(value, (dict, list)):
-                        find_items(value)
-            elif isinstance(current_data, list):
-                for item in current_data: 
-                    find_items(item)
+                        stack.append(value)
+            elif isinstance(current, list):
+                stack.extend(item for item in current if isinstance(item, (dict, list)))
 
-        find_items(data)
+    def translate_json_data(self, data, track_cycles=False, **kwargs):
         on_progress = kwargs.pop('on_progress', None)
-
-        for i, (container, key) in enumerate(items_to_translate):
-            if on_progress: on_progress(i, len(items_to_translate))
-            original_value = container[key]
-            container[key] = self.translate_text(original_value, **kwargs)
-
-        if on_progress: on_progress(len(items_to_translate), len(items_to_translate))
+        if on_progress:
+            # Cache hits finish in microseconds; throttle UI marshaling to
+            # one emit per 50ms, always letting the final update through
+            raw_progress, last_emit = on_progress, [0.0]
+
+            def on_progress(done, total):
+                now = time.monotonic()
+                if done >= total or now - last_emit[0] > 0.05:
+                    last_emit[0] = now
+                    raw_progress(done, total)
+
+        # Identical strings (default prompts repeated across sections) are
+        # translated once and scattered to every destination
+        groups = defaultdict(list)
+        for container, key in self._iter_targets(data, track_cycles):
+            groups[container[key]].append((container, key))
+        total = len(groups)
+
+        if not groups:
+            if on_progress: on_progress(0, 0)
+            return data
+
+        # Coalesce short strings into batched requests — one prompt per
+        # bucket for LLMs, one sentinel-joined request for Google — so N
+        # round trips collapse into a handful. Oversized strings ride alone.
+        use_llm = bool(kwargs.get('use_llm') and kwargs.get('llm_config'))
+        batches, current_batch, current_len = [], [], 0
+        for value in groups:
+            if len(value) > MAX_BATCH_CHARS:
+                batches.append([value])
+                continue
+            if current_batch and current_len + len(value) > MAX_BATCH_CHARS:
+                batches.append(current_batch)
+                current_batch, current_len = [], 0
+            current_batch.append(value)
+            current_len += len(value)
+        if current_batch:
+            batches.append(current_batch)
+
+        def run_batch(batch):
+            if len(batch) == 1:
+                return [self.translate_text(batch[0], **kwargs)]
+            if use_llm:
+                return self._translate_texts_batch(batch, **kwargs)
+            return self._translate_texts_google_batch(batch, **kwargs)
+
+        # Each batch is an HTTP round trip, so wall time is dominated by
+        # latency; run them on a bounded pool instead of serially so
+        # several requests are in flight at once
+        done_count = 0
+        progress_lock = threading.Lock()
+
+        with ThreadPoolExecutor(max_workers=min(kwargs.pop('workers', 8), len(batches))) as pool:
+            futures = {pool.submit(run_batch, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                for value, translated in zip(batch, future.result()):
+                    for container, key in groups[value]:
+                        container[key] = translated
+                with progress_lock:
+                    done_count += len(batch)
+                    current = done_count
+                if on_progress: on_progress(current, total)
+
+        if on_progress: on_progress(total, total)
         return data
\ No newline at end of file
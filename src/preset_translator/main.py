@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from engine import TranslationConfig, TranslationEngine, load_json_safe, save_json
 
 class TranslatorApp:
@@ -16,9 +18,24 @@ class TranslatorApp:
         
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Progress coalescing: workers overwrite the latest snapshot and the
+        # UI thread renders whatever is current when its callback runs.
+        self._pending_progress = None
+        self._last_progress_ts = 0.0
+        self._ui_dirty = False
+
+        # Mirrors the Listbox contents for O(1) duplicate checks without
+        # marshalling the whole list out of Tk on every selection.
+        self._file_set = set()
+
+        # Shared worker pool, created on first use and reused across runs
+        # so repeated translations don't pay thread spin-up each time.
+        self._executor = None
+
         self.translate_angle_var = tk.BooleanVar(value=self.config.data.get("translate_angle"))
         self.save_location_var = tk.StringVar(value=self.config.data.get("save_location"))
         self.use_llm_var = tk.BooleanVar(value=self.config.data.get("use_llm_translation"))
+        self.force_retranslate_var = tk.BooleanVar(value=False)
         self.llm_provider_var = tk.StringVar(value=self.config.data.get("llm_provider"))
         
         self.openrouter_api_key_var = tk.StringVar(value=self.config.data.get("openrouter_api_key"))
@@ -28,6 +45,16 @@ class TranslatorApp:
         self.nanogpt_api_key_var = tk.StringVar(value=self.config.data.get("nanogpt_api_key"))
         self.nanogpt_model_var = tk.StringVar(value=self.config.data.get("nanogpt_model"))
 
+        # Any settings change flips the dirty flag; _save_config becomes a
+        # no-op otherwise, so closing or starting a run never rebuilds and
+        # rewrites an unchanged config.
+        self._config_dirty = False
+        for var in (self.translate_angle_var, self.save_location_var, self.use_llm_var,
+                    self.llm_provider_var, self.openrouter_api_key_var, self.openrouter_model_var,
+                    self.groq_api_key_var, self.groq_model_var,
+                    self.nanogpt_api_key_var, self.nanogpt_model_var):
+            var.trace_add("write", self._mark_config_dirty)
+
         main_frame = ttk.Frame(root, padding="15")
         main_frame.pack(fill=tk.BOTH, expand=True)
         main_frame.columnconfigure(0, weight=1)
@@ -42,8 +69,15 @@ class TranslatorApp:
 
     def on_closing(self):
         self._save_config()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
 
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="translate")
+        return self._executor
+
     def _create_top_options_frame(self, parent):
         frame = ttk.Frame(parent)
         frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
@@ -60,6 +94,7 @@ class TranslatorApp:
         options_frame = ttk.Frame(frame)
         options_frame.grid(row=0, column=1, sticky="e")
         ttk.Checkbutton(options_frame, text="Translate content inside <...> brackets (LLM only)", variable=self.translate_angle_var).pack(side=tk.LEFT, padx=(0, 15))
+        ttk.Checkbutton(options_frame, text="Force re-translate", variable=self.force_retranslate_var).pack(side=tk.LEFT, padx=(0, 15))
         
         ttk.Label(options_frame, text="Save Location:").pack(side=tk.LEFT, padx=(0,5))
         
@@ -92,9 +127,14 @@ class TranslatorApp:
         provider_frame = ttk.Frame(self.llm_options_frame)
         provider_frame.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, 5))
         ttk.Label(provider_frame, text="Provider:").pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Radiobutton(provider_frame, text="OpenRouter", variable=self.llm_provider_var, value="openrouter", command=self._update_llm_provider_ui).pack(side=tk.LEFT)
-        ttk.Radiobutton(provider_frame, text="Groq", variable=self.llm_provider_var, value="groq", command=self._update_llm_provider_ui).pack(side=tk.LEFT, padx=10)
-        ttk.Radiobutton(provider_frame, text="NanoGPT", variable=self.llm_provider_var, value="nanogpt", command=self._update_llm_provider_ui).pack(side=tk.LEFT)
+        self._provider_radios = [
+            ttk.Radiobutton(provider_frame, text="OpenRouter", variable=self.llm_provider_var, value="openrouter", command=self._update_llm_provider_ui),
+            ttk.Radiobutton(provider_frame, text="Groq", variable=self.llm_provider_var, value="groq", command=self._update_llm_provider_ui),
+            ttk.Radiobutton(provider_frame, text="NanoGPT", variable=self.llm_provider_var, value="nanogpt", command=self._update_llm_provider_ui),
+        ]
+        self._provider_radios[0].pack(side=tk.LEFT)
+        self._provider_radios[1].pack(side=tk.LEFT, padx=10)
+        self._provider_radios[2].pack(side=tk.LEFT)
 
         self.or_api_label = ttk.Label(self.llm_options_frame, text="OpenRouter API Key:")
         self.or_model_label = ttk.Label(self.llm_options_frame, text="OpenRouter Model:")
@@ -158,6 +198,7 @@ class TranslatorApp:
         lang_code = self.config.get_lang_code(selected_lang_name)
         if lang_code and lang_code != self.config.current_lang:
             self.config.current_lang = lang_code
+            self._config_dirty = True
 
     def _update_llm_provider_ui(self):
         provider = self.llm_provider_var.get()
@@ -193,9 +234,15 @@ class TranslatorApp:
         path = filedialog.askdirectory(title="Select Your SillyTavern Root Folder")
         if path:
             self.config.data['silly_tavern_path'] = path
+            self._config_dirty = True
             messagebox.showinfo("Path Set", f"SillyTavern path set to:\n{path}")
 
+    def _mark_config_dirty(self, *_):
+        self._config_dirty = True
+
     def _save_config(self):
+        if not self._config_dirty:
+            return
         self.config.data.update({
             "last_used_language": self.config.current_lang,
             "translate_angle": self.translate_angle_var.get(),
@@ -210,6 +257,7 @@ class TranslatorApp:
             "nanogpt_model": self.nanogpt_model_var.get()
         })
         self.config.save()
+        self._config_dirty = False
         print("Configuration saved.")
 
     def select_files(self):
@@ -217,14 +265,26 @@ class TranslatorApp:
             title="Select Character Files",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
-        current_files = set(self.file_list.get(0, tk.END))
-        for fp in filepaths:
-            if fp not in current_files:
-                self.file_list.insert(tk.END, fp)
+        new = [fp for fp in filepaths if fp not in self._file_set]
+        if new:
+            self.file_list.insert(tk.END, *new)
+            self._file_set.update(new)
 
     def remove_selected_files(self):
-        for index in reversed(self.file_list.curselection()):
-            self.file_list.delete(index)
+        selection = self.file_list.curselection()
+        if not selection:
+            return
+        for index in selection:
+            self._file_set.discard(self.file_list.get(index))
+        # Delete contiguous runs back to front so earlier indices stay valid.
+        end = start = selection[-1]
+        for index in reversed(selection[:-1]):
+            if index == start - 1:
+                start = index
+            else:
+                self.file_list.delete(start, end)
+                end = start = index
+        self.file_list.delete(start, end)
 
     def set_ui_state(self, is_enabled):
         state = "normal" if is_enabled else "disabled"
@@ -242,11 +302,8 @@ class TranslatorApp:
             entry.config(state=state)
         
         # Provider radios
-        for child in self.llm_options_frame.winfo_children():
-            if isinstance(child, ttk.Frame):
-                for sub in child.winfo_children():
-                    if isinstance(sub, ttk.Radiobutton):
-                        sub.config(state=state)
+        for radio in self._provider_radios:
+            radio.config(state=state)
 
     def start_translation(self):
         self._save_config()
@@ -256,7 +313,7 @@ class TranslatorApp:
             return
 
         save_dir = ""
-        save_location = self.config.data["save_location"]
+        save_location = self.save_location_var.get()
         if save_location == "silly":
             save_dir = self.config.data.get("silly_tavern_path")
             if not save_dir or not os.path.isdir(save_dir):
@@ -268,17 +325,27 @@ class TranslatorApp:
                 self.status_label.config(text="Idle")
                 return
 
-        provider = self.config.data['llm_provider']
+        # Read settings straight from the Variables; _save_config already
+        # persisted them, so there is no need to round-trip through
+        # config.data here.
+        provider = self.llm_provider_var.get()
+        use_llm = self.use_llm_var.get()
+        provider_vars = {
+            "openrouter": (self.openrouter_api_key_var, self.openrouter_model_var),
+            "groq": (self.groq_api_key_var, self.groq_model_var),
+            "nanogpt": (self.nanogpt_api_key_var, self.nanogpt_model_var),
+        }
+        api_key_var, model_var = provider_vars[provider]
         kwargs = {
             "target_lang_code": self.config.current_lang,
             "target_lang_name": self.config.get_native_name(self.config.current_lang),
-            "use_llm": self.config.data["use_llm_translation"],
-            "translate_angle": self.config.data.get("translate_angle"),
+            "use_llm": use_llm,
+            "translate_angle": self.translate_angle_var.get(),
             "llm_config": {
                 "provider": provider,
-                "api_key": self.config.data.get(f"{provider}_api_key"),
-                "model": self.config.data.get(f"{provider}_model")
-            } if self.config.data["use_llm_translation"] else None
+                "api_key": api_key_var.get(),
+                "model": model_var.get()
+            } if use_llm else None
         }
 
         if kwargs["use_llm"] and (not kwargs["llm_config"]["api_key"] or not kwargs["llm_config"]["model"]):
@@ -289,9 +356,23 @@ class TranslatorApp:
         self.progress_bar['value'] = 0
         self.status_label.config(text="Starting translation...")
 
-        thread = threading.Thread(target=self._translation_worker, args=(files, save_dir, kwargs), daemon=True)
+        force = self.force_retranslate_var.get()
+        thread = threading.Thread(target=self._translation_worker, args=(files, save_dir, kwargs, force), daemon=True)
         thread.start()
 
+    def _set_status(self, text):
+        self.status_label.config(text=text)
+
+    def _set_progress(self, value):
+        self.progress_bar.config(value=value)
+
+    def _flush_ui(self):
+        """Render the most recent progress snapshot on the UI thread."""
+        self._ui_dirty = False
+        pending = self._pending_progress
+        if pending:
+            self._update_progress(*pending)
+
     def _update_progress(self, current_file, total_files, filename, current_field, total_fields):
         """Callback to update the progress bar and status label with detailed info."""
         if total_files > 0:
@@ -314,48 +395,82 @@ class TranslatorApp:
             
             self.status_label.config(text=status_msg)
 
-    def _translation_worker(self, files, save_dir, kwargs):
+    def _translate_one_file(self, index, total_files, file_path, output_dir, kwargs, force):
+        filename = os.path.basename(file_path)
+        base, ext = os.path.splitext(filename)
+        output_path = os.path.join(output_dir, f"{base}_{kwargs['target_lang_code']}{ext}")
+
+        if not force:
+            try:
+                if os.path.getmtime(output_path) >= os.path.getmtime(file_path):
+                    print(f"Skipping {filename}: translated output is up to date.")
+                    self.root.after(0, self._update_progress, index, total_files, file_path, 0, 0)
+                    return True
+            except OSError:
+                pass  # no output yet (or input vanished) — translate normally
+
+        def field_progress_callback(current_field, total_fields):
+            # Throttle to ~20 updates/s so large files do not flood
+            # the Tk event queue; first/last ticks always go through.
+            self._pending_progress = (index, total_files, file_path, current_field, total_fields)
+            now = time.monotonic()
+            if now - self._last_progress_ts >= 0.05 or current_field in (0, total_fields):
+                self._last_progress_ts = now
+                # One scheduled flush at a time: bursts from concurrent
+                # files collapse into a single paint per idle cycle.
+                if not self._ui_dirty:
+                    self._ui_dirty = True
+                    self.root.after_idle(self._flush_ui)
+
+        json_data = load_json_safe(file_path)
+        if not json_data:
+            print(f"Failed to load or empty JSON: {file_path}")
+            self.root.after(0, self._update_progress, index, total_files, file_path, 0, 0)
+            return False
+
+        # Perform translation
+        translated_data = self.engine.translate_json_data(
+            data=json_data, on_progress=field_progress_callback, **kwargs)
+
+        # Save result
+        if not save_json(output_path, translated_data):
+            raise IOError(f"Failed to save translated file to {output_path}")
+        return True
+
+    def _translation_worker(self, files, save_dir, kwargs, force=False):
         try:
             total_files = len(files)
-            for i, file_path in enumerate(files):
-                filename = os.path.basename(file_path)
-                
-                def field_progress_callback(current_field, total_fields):
-                    self.root.after(0, self._update_progress, i, total_files, file_path, current_field, total_fields)
-
-                kwargs_with_progress = kwargs.copy()
-                kwargs_with_progress['on_progress'] = field_progress_callback
-
-                self.root.after(0, lambda f=filename: self.status_label.config(text=f"Loading: {f}..."))
-                json_data = load_json_safe(file_path)
-                if not json_data:
-                    print(f"Failed to load or empty JSON: {file_path}")
-                    self.root.after(0, self._update_progress, i, total_files, file_path, 0, 0)
-                    continue
-                
-                # Perform translation
-                translated_data = self.engine.translate_json_data(data=json_data, **kwargs_with_progress)
-                
-                # Save result
-                base, ext = os.path.splitext(filename)
-                new_filename = f"{base}_{kwargs['target_lang_code']}{ext}"
-                
-                potential_char_dir = os.path.join(save_dir, "public", "characters")
-                output_dir = potential_char_dir if os.path.isdir(potential_char_dir) else save_dir
-                
-                output_path = os.path.join(output_dir, new_filename)
-                if not save_json(output_path, translated_data):
-                    raise IOError(f"Failed to save translated file to {output_path}")
-
-            self.root.after(0, lambda: self.progress_bar.config(value=100))
-            self.root.after(0, lambda: self.status_label.config(text=f"Completed {total_files}/{total_files} files."))
-            self.root.after(0, lambda: messagebox.showinfo("Success", "Translation completed successfully."))
+            # save_dir never changes during a run, so resolve the
+            # SillyTavern characters folder once instead of per file.
+            potential_char_dir = os.path.join(save_dir, "public", "characters")
+            output_dir = potential_char_dir if os.path.isdir(potential_char_dir) else save_dir
+            # Files are dominated by network wait (LLM/Google calls), so a
+            # small thread pool gives near-linear speedup over the old
+            # sequential loop without extra CPU cost.
+            done_lock = threading.Lock()
+            done_files = 0
+            executor = self._get_executor()
+            futures = [
+                executor.submit(self._translate_one_file, i, total_files, fp, output_dir, kwargs, force)
+                for i, fp in enumerate(files)
+            ]
+            for future in as_completed(futures):
+                future.result()  # surface the first failure
+                with done_lock:
+                    done_files += 1
+                    done = done_files
+                self.root.after(0, self._set_status, f"Completed {done}/{total_files} files.")
+
+            self.root.after(0, self._set_progress, 100)
+            self.root.after(0, self._set_status, f"Completed {total_files}/{total_files} files.")
+            self.root.after(0, messagebox.showinfo, "Success", "Translation completed successfully.")
         except Exception as e:
             print(f"Translation Error: {e}")
-            self.root.after(0, lambda e=e: messagebox.showerror("Translation Error", f"An error occurred during translation:\n\n{str(e)}"))
+            self.root.after(0, messagebox.showerror, "Translation Error",
+                            f"An error occurred during translation:\n\n{str(e)}")
         finally:
-            self.root.after(0, lambda: self.set_ui_state(True))
-            self.root.after(0, lambda: self.status_label.config(text="Idle"))
+            self.root.after(0, self.set_ui_state, True)
+            self.root.after(0, self._set_status, "Idle")
 
 
 if __name__ == "__main__":